@@ -0,0 +1,102 @@
+"""
+Benchmarks for the PDF utilities.
+
+Synthetic documents are built by repeating the pages of git-cheatsheet.pdf.
+
+Usage:
+    python benchmark.py extraction --pages 400 --workers 4
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import PyPDF2
+
+from read_pdf import extract_text_from_pdf
+
+SAMPLE_PDF = Path(__file__).with_name("git-cheatsheet.pdf")
+
+
+def build_pdf(output_path: str, pages: int, sample_pdf: Path = SAMPLE_PDF):
+    """
+    Write a PDF of `pages` pages by repeating the pages of a sample PDF.
+
+    Args:
+        output_path: Path where the PDF will be saved
+        pages: Number of pages to write
+        sample_pdf: PDF whose pages are repeated
+    """
+    reader = PyPDF2.PdfReader(str(sample_pdf))
+    writer = PyPDF2.PdfWriter()
+    for index in range(pages):
+        writer.add_page(reader.pages[index % len(reader.pages)])
+    with open(output_path, "wb") as pdf_file:
+        writer.write(pdf_file)
+
+
+def legacy_extract_text(pdf_path: str) -> str:
+    """The original sequential extractor, concatenating with +=."""
+    extracted_text = ""
+    with open(pdf_path, "rb") as pdf_file:
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        for page in pdf_reader.pages:
+            extracted_text += page.extract_text() + "\n"
+    return extracted_text
+
+
+def benchmark_extraction(pages: int, workers: int):
+    """
+    Time the original extractor against extract_text_from_pdf.
+
+    Args:
+        pages: Number of pages in the synthetic document
+        workers: Number of worker processes for the parallel case
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = os.path.join(tmp_dir, "benchmark.pdf")
+        build_pdf(pdf_path, pages)
+
+        cases = {
+            "legacy": lambda: legacy_extract_text(pdf_path),
+            "sequential": lambda: extract_text_from_pdf(pdf_path, max_workers=1),
+            f"parallel ({workers} workers)": lambda: extract_text_from_pdf(
+                pdf_path, max_workers=workers
+            ),
+        }
+        results = {}
+        for name, run in cases.items():
+            start = time.perf_counter()
+            results[name] = run()
+            seconds = time.perf_counter() - start
+            print(f"{name:<24} {seconds:7.2f}s  {pages / seconds:8.1f} pages/sec")
+
+        if len(set(results.values())) != 1:
+            print("warning: extracted text differs between cases")
+
+
+if __name__ == "__main__":
+    # read_pdf configures INFO logging on import; keep the timings readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark the PDF utilities")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    extraction_parser = subparsers.add_parser(
+        "extraction", help="Sequential vs parallel PDF text extraction"
+    )
+    extraction_parser.add_argument(
+        "--pages", type=int, default=400, help="Pages in the synthetic PDF"
+    )
+    extraction_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for the parallel case (default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark == "extraction":
+        benchmark_extraction(args.pages, args.workers)
@@ -9,38 +9,638 @@ Features:
 - Batch processing support
 - Configurable output directory
 - Error handling for invalid images
+- Streaming mode that writes one page at a time for large directories
+- Recursive batch mode converting each folder to its own PDF in parallel
+- Optional downscaling and JPEG recompression to shrink the PDF
 - Logging support
 
 Usage:
     python image2pdf.py --directory /path/to/images/ --output result.pdf
+    python image2pdf.py --directory /path/to/scans/ --output scans.pdf --stream
 """
 
+import io
 import os
 import logging
+import re
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Callable, Iterable, Iterator, List, NamedTuple, Optional
 
 import img2pdf
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Resolution assumed for images without DPI metadata (same as img2pdf)
+DEFAULT_DPI = 96
+# JPEGs in these modes are embedded as-is, without decoding
+JPEG_COLORSPACES = {"L": "/DeviceGray", "RGB": "/DeviceRGB"}
+# EXIF orientation tag values that map to a plain page rotation
+EXIF_ROTATIONS = {1: 0, 3: 180, 6: 90, 8: 270}
+EXIF_ORIENTATION_TAG = 0x0112
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# PNG color type -> (PDF color space, components per pixel)
+PNG_COLORSPACES = {0: ("/DeviceGray", 1), 2: ("/DeviceRGB", 3)}
+# Quality for JPEGs that have to be re-encoded after downscaling
+DEFAULT_JPEG_QUALITY = 90
+DIGITS_PATTERN = re.compile(r"(\d+)")
+
+
+class PageImage(NamedTuple):
+    """An encoded image ready to be written as a PDF page."""
+
+    width: int
+    height: int
+    dpi: tuple
+    colorspace: str
+    filter: str
+    data: bytes
+    rotate: int = 0
+    bits: int = 8
+    decode_parms: str = ""
+
+
+class StreamingPdfWriter:
+    """
+    Write image pages to a PDF file one at a time.
+
+    Each page is written as soon as it is added, so only the current page's
+    image data is held in memory. The page tree and cross-reference table are
+    written by close().
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Start a PDF document.
+
+        Args:
+            stream: Binary file object opened for writing
+        """
+        self.stream = stream
+        self.offsets: List[Optional[int]] = []
+        self.page_ids: List[int] = []
+        self.stream.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self.catalog_id = self._reserve()
+        self.pages_id = self._reserve()
+
+    def _reserve(self) -> int:
+        """Reserve the next object number."""
+        self.offsets.append(None)
+        return len(self.offsets)
+
+    def _write_object(self, obj_id: int, body: bytes, data: Optional[bytes] = None):
+        """
+        Write one indirect object, with an optional stream.
+
+        Args:
+            obj_id: Object number from _reserve
+            body: Object dictionary (must include /Length if data is given)
+            data: Stream content
+        """
+        self.offsets[obj_id - 1] = self.stream.tell()
+        self.stream.write(b"%d 0 obj\n" % obj_id + body)
+        if data is not None:
+            self.stream.write(b"\nstream\n")
+            self.stream.write(data)
+            self.stream.write(b"\nendstream")
+        self.stream.write(b"\nendobj\n")
+
+    def add_page(self, page: PageImage):
+        """
+        Write a page showing one image at its physical size.
+
+        Args:
+            page: Encoded image to place on the page
+        """
+        width = page.width * 72.0 / page.dpi[0]
+        height = page.height * 72.0 / page.dpi[1]
+
+        image_id = self._reserve()
+        self._write_object(
+            image_id,
+            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+            b"/ColorSpace %s /BitsPerComponent %d /Filter %s %s/Length %d >>"
+            % (
+                page.width,
+                page.height,
+                page.colorspace.encode(),
+                page.bits,
+                page.filter.encode(),
+                (
+                    b"/DecodeParms %s " % page.decode_parms.encode()
+                    if page.decode_parms
+                    else b""
+                ),
+                len(page.data),
+            ),
+            page.data,
+        )
+        content = b"q %.4f 0 0 %.4f 0 0 cm /Im0 Do Q" % (width, height)
+        content_id = self._reserve()
+        self._write_object(content_id, b"<< /Length %d >>" % len(content), content)
+        page_id = self._reserve()
+        self._write_object(
+            page_id,
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.4f %.4f] "
+            b"/Resources << /XObject << /Im0 %d 0 R >> >> /Contents %d 0 R "
+            b"/Rotate %d >>"
+            % (self.pages_id, width, height, image_id, content_id, page.rotate),
+        )
+        self.page_ids.append(page_id)
+
+    def close(self):
+        """Write the page tree, catalog and cross-reference table."""
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self.page_ids)
+        self._write_object(
+            self.pages_id,
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.page_ids)),
+        )
+        self._write_object(
+            self.catalog_id, b"<< /Type /Catalog /Pages %d 0 R >>" % self.pages_id
+        )
+        xref_offset = self.stream.tell()
+        self.stream.write(b"xref\n0 %d\n" % (len(self.offsets) + 1))
+        self.stream.write(b"0000000000 65535 f \n")
+        for offset in self.offsets:
+            self.stream.write(b"%010d 00000 n \n" % offset)
+        self.stream.write(
+            b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(self.offsets) + 1, self.catalog_id, xref_offset)
+        )
+
+
+def _image_dpi(image) -> tuple:
+    """Return an image's (x, y) resolution, falling back to DEFAULT_DPI."""
+    dpi = image.info.get("dpi") or (DEFAULT_DPI, DEFAULT_DPI)
+    # PNG stores dots per meter, so round like img2pdf does
+    return tuple(round(value) if value and value > 0 else DEFAULT_DPI for value in dpi)
+
+
+def _png_chunks(data: bytes) -> Iterator[tuple]:
+    """Yield the (type, body) of each chunk in PNG file data."""
+    position = len(PNG_SIGNATURE)
+    while position + 8 <= len(data):
+        length, kind = struct.unpack(">I4s", data[position : position + 8])
+        yield kind, data[position + 8 : position + 8 + length]
+        position += length + 12
+
+
+def _png_page(
+    data: bytes, dpi: tuple, colorspace: Optional[str] = None
+) -> Optional[PageImage]:
+    """
+    Embed PNG data without decoding it.
+
+    PDF's Flate filter with PNG predictors reads the concatenated IDAT chunks
+    directly, like img2pdf does.
+
+    Args:
+        data: PNG file data
+        dpi: Image (x, y) resolution
+        colorspace: PDF color space for palette PNGs (palette PNGs are not
+            embedded without it)
+
+    Returns:
+        Optional[PageImage]: The page, or None if the PNG is interlaced,
+        16-bit or has transparency
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return None
+    chunks = list(_png_chunks(data))
+    width, height, bits, color_type, _, _, interlace = struct.unpack(
+        ">IIBBBBB", chunks[0][1][:13]
+    )
+    if interlace or bits > 8 or any(kind == b"tRNS" for kind, _ in chunks):
+        return None
+    if color_type in PNG_COLORSPACES:
+        colorspace, colors = PNG_COLORSPACES[color_type]
+    elif color_type == 3 and colorspace:
+        colors = 1
+    else:
+        return None
+    return PageImage(
+        width,
+        height,
+        dpi,
+        colorspace,
+        "/FlateDecode",
+        b"".join(body for kind, body in chunks if kind == b"IDAT"),
+        bits=bits,
+        decode_parms=f"<< /Predictor 15 /Colors {colors} "
+        f"/BitsPerComponent {bits} /Columns {width} >>",
+    )
+
+
+def _flatten(frame, keep_palette: bool = False):
+    """
+    Convert an image frame to 8-bit gray, RGB, CMYK or palette pixels.
+
+    Transparent images are composited onto a white background.
+
+    Args:
+        frame: Pillow image frame
+        keep_palette: Keep palette images (GIF, PNG-8) indexed instead of
+            expanding them to RGB
+
+    Returns:
+        tuple: The converted frame and its PDF color space
+    """
+    from PIL import Image
+
+    transparency = frame.info.get("transparency")
+    if frame.mode == "P" and keep_palette and not isinstance(transparency, bytes):
+        palette = frame.getpalette()
+        if transparency is not None:
+            # A single transparent color renders as the white page beneath it
+            palette[3 * transparency : 3 * transparency + 3] = [255, 255, 255]
+        return frame, (
+            f"[/Indexed /DeviceRGB {len(palette) // 3 - 1} <{bytes(palette).hex()}>]"
+        )
+    if frame.mode == "CMYK":
+        return frame, "/DeviceCMYK"
+    if frame.mode in ("RGBA", "LA", "PA") or transparency is not None:
+        rgba = frame.convert("RGBA")
+        flat = Image.new("RGB", frame.size, "white")
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        return flat, "/DeviceRGB"
+    if frame.mode in ("1", "L"):
+        return frame.convert("L"), "/DeviceGray"
+    return frame.convert("RGB"), "/DeviceRGB"
+
+
+class CompressionOptions(NamedTuple):
+    """Settings for shrinking images before they are written to the PDF."""
+
+    target_dpi: Optional[float] = None
+    max_width: Optional[int] = None
+    max_height: Optional[int] = None
+    jpeg_quality: Optional[int] = None
+
+
+def _scale_factor(size: tuple, dpi: tuple, compression: CompressionOptions) -> float:
+    """
+    Return the factor (at most 1) an image must be scaled by to fit the limits.
+
+    Args:
+        size: Image (width, height) in pixels
+        dpi: Image (x, y) resolution
+        compression: Resolution and size limits
+    """
+    scale = 1.0
+    if compression.target_dpi:
+        scale = min(scale, compression.target_dpi / max(dpi))
+    if compression.max_width:
+        scale = min(scale, compression.max_width / size[0])
+    if compression.max_height:
+        scale = min(scale, compression.max_height / size[1])
+    return scale
+
+
+def _encode_frame(
+    frame,
+    dpi: tuple,
+    compression: Optional[CompressionOptions],
+    source_format: Optional[str] = None,
+) -> PageImage:
+    """
+    Downscale and encode one decoded frame.
+
+    The resolution is scaled with the pixels, so the page keeps its physical
+    size. Frames are stored losslessly as PNG-predicted Flate streams unless a
+    JPEG quality is set; downscaled JPEGs stay JPEG.
+
+    Args:
+        frame: Pillow image frame, already rotated upright
+        dpi: Image (x, y) resolution
+        compression: Optional limits and JPEG quality
+        source_format: Pillow format name of the source file
+
+    Returns:
+        PageImage: The encoded page
+    """
+    from PIL import Image
+
+    frame, colorspace = _flatten(frame, keep_palette=compression is not None)
+    jpeg_quality = None
+    if compression is not None:
+        scale = _scale_factor(frame.size, dpi, compression)
+        if scale < 1:
+            size = (
+                max(1, round(frame.width * scale)),
+                max(1, round(frame.height * scale)),
+            )
+            dpi = (dpi[0] * size[0] / frame.width, dpi[1] * size[1] / frame.height)
+            # Palette images are resized with nearest-neighbour to keep the palette
+            resample = Image.NEAREST if frame.mode == "P" else Image.LANCZOS
+            frame = frame.resize(size, resample)
+        jpeg_quality = compression.jpeg_quality or (
+            DEFAULT_JPEG_QUALITY if source_format == "JPEG" else None
+        )
+
+    if jpeg_quality and not colorspace.startswith("[/Indexed"):
+        if frame.mode == "CMYK":
+            frame, colorspace = frame.convert("RGB"), "/DeviceRGB"
+        buffer = io.BytesIO()
+        frame.save(buffer, "JPEG", quality=jpeg_quality, optimize=True)
+        return PageImage(
+            frame.width, frame.height, dpi, colorspace, "/DCTDecode", buffer.getvalue()
+        )
+    if frame.mode != "CMYK":
+        buffer = io.BytesIO()
+        frame.save(buffer, "PNG", transparency=None)
+        page = _png_page(buffer.getvalue(), dpi, colorspace)
+        if page is not None:
+            return page
+    return PageImage(
+        frame.width,
+        frame.height,
+        dpi,
+        colorspace,
+        "/FlateDecode",
+        zlib.compress(frame.tobytes()),
+    )
+
+
+def read_image_pages(
+    image_path: Path, compression: Optional[CompressionOptions] = None
+) -> List[PageImage]:
+    """
+    Validate an image and encode it for a PDF page.
+
+    JPEGs and plain PNGs are embedded without re-encoding unless they have to
+    be downscaled or recompressed; other images are decoded and re-encoded,
+    one page per frame.
+
+    Args:
+        image_path: Path to the image file
+        compression: Optional downscaling and recompression settings
+
+    Returns:
+        List[PageImage]: Encoded pages, empty if the image is invalid
+    """
+    from PIL import Image, ImageOps, ImageSequence
+
+    try:
+        with Image.open(image_path) as image:
+            dpi = _image_dpi(image)
+            orientation = image.getexif().get(EXIF_ORIENTATION_TAG, 1)
+            upright_size = image.size[::-1] if orientation in (6, 8) else image.size
+            embed_as_is = orientation in EXIF_ROTATIONS and (
+                compression is None
+                or (
+                    compression.jpeg_quality is None
+                    and _scale_factor(upright_size, dpi, compression) >= 1
+                )
+            )
+            if (
+                embed_as_is
+                and image.format == "JPEG"
+                and image.mode in JPEG_COLORSPACES
+            ):
+                return [
+                    PageImage(
+                        image.width,
+                        image.height,
+                        dpi,
+                        JPEG_COLORSPACES[image.mode],
+                        "/DCTDecode",
+                        Path(image_path).read_bytes(),
+                        EXIF_ROTATIONS[orientation],
+                    )
+                ]
+            if (
+                embed_as_is
+                and image.format == "PNG"
+                and orientation == 1
+                and getattr(image, "n_frames", 1) == 1
+            ):
+                page = _png_page(Path(image_path).read_bytes(), dpi)
+                if page is not None:
+                    return [page]
+
+            return [
+                _encode_frame(
+                    ImageOps.exif_transpose(frame), dpi, compression, image.format
+                )
+                for frame in ImageSequence.Iterator(image)
+            ]
+    except (OSError, ValueError) as e:
+        logger.warning(f"Skipping invalid image {image_path}: {str(e)}")
+        return []
+
+
+def _map_ordered(
+    executor: Executor, func: Callable, items: Iterable, window: int
+) -> Iterator:
+    """
+    Map func over items in an executor, yielding results in input order.
+
+    At most `window` results are pending at once, which bounds memory use.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _peak_memory_mb() -> Optional[float]:
+    """Return the process's peak resident memory in MB, if available."""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if os.uname().sysname == "Darwin" else 1024)
+
+
+def _log_throughput(pages: int, seconds: float, output_path: str):
+    """Log the output size, pages/sec and peak memory of a conversion."""
+    peak = _peak_memory_mb()
+    memory = f", peak memory {peak:.0f} MB" if peak is not None else ""
+    size = os.path.getsize(output_path) / (1024 * 1024)
+    logger.info(
+        f"Wrote {pages} pages ({size:.1f} MB) in {seconds:.2f}s "
+        f"({pages / max(seconds, 1e-9):.1f} pages/sec{memory})"
+    )
+
+
+def write_pdf_streaming(
+    image_files: Iterable[Path],
+    output_path: str,
+    max_workers: int = 4,
+    compression: Optional[CompressionOptions] = None,
+) -> int:
+    """
+    Write images to a PDF one page at a time.
+
+    Images are validated and encoded in a thread pool while earlier pages are
+    written, with only a few images in flight at once.
+
+    Args:
+        image_files: Image paths in page order
+        output_path: Path where PDF will be saved
+        max_workers: Number of threads reading images
+        compression: Optional downscaling and recompression settings
+
+    Returns:
+        int: Number of pages written
+    """
+    read_pages = partial(read_image_pages, compression=compression)
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as pdf_file:
+            writer = StreamingPdfWriter(pdf_file)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for pages in _map_ordered(
+                    executor, read_pages, image_files, 2 * max_workers
+                ):
+                    for page in pages:
+                        writer.add_page(page)
+            writer.close()
+
+        if not writer.page_ids:
+            os.remove(tmp_path)
+            return 0
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        # Don't leave a partial PDF behind on errors or Ctrl+C
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(writer.page_ids)
+
+
+def _suffixes(image_formats: List[str]) -> tuple:
+    """Return lowercase file suffixes ('.png', ...) for image formats."""
+    return tuple(f".{fmt.lower().lstrip('.')}" for fmt in image_formats)
+
+
+def iter_images(image_directory: str, image_formats: List[str]) -> Iterator[str]:
+    """
+    Yield image paths in a directory, in directory order.
+
+    The directory is read in a single os.scandir pass, matching suffixes
+    case-insensitively, without building the full list of files.
+
+    Args:
+        image_directory: Path to directory containing images
+        image_formats: List of file extensions to match
+
+    Returns:
+        Iterator[str]: Paths of the matching files
+    """
+    suffixes = _suffixes(image_formats)
+    with os.scandir(image_directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(suffixes) and entry.is_file():
+                yield entry.path
+
+
+def natural_sort_key(path: str) -> tuple:
+    """
+    Sort key ordering file names by their numbers (page2 before page10).
+
+    Args:
+        path: File path
+
+    Returns:
+        tuple: Key comparing text case-insensitively and digit runs as numbers
+    """
+    name = os.path.basename(path)
+    parts = DIGITS_PATTERN.split(name.lower())
+    return tuple(int(part) if part.isdigit() else part for part in parts), name
+
+
+def find_images(image_directory: str, image_formats: List[str]) -> List[str]:
+    """
+    List image paths in a directory in natural filename order.
+
+    Args:
+        image_directory: Path to directory containing images
+        image_formats: List of file extensions to match
+
+    Returns:
+        List[str]: Paths of the matching files
+    """
+    return sorted(iter_images(image_directory, image_formats), key=natural_sort_key)
+
+
+def _write_pdf(
+    image_list: Iterable[str],
+    output_path: str,
+    streaming: bool,
+    max_workers: int,
+    compression: Optional[CompressionOptions] = None,
+) -> int:
+    """
+    Write images to a PDF with img2pdf or the streaming writer.
+
+    Compression always uses the streaming writer, which does the encoding.
+
+    Returns:
+        int: Number of pages written
+    """
+    if streaming or compression is not None:
+        return write_pdf_streaming(image_list, output_path, max_workers, compression)
+    # Convert before opening the output so a failure leaves no partial file
+    image_list = list(image_list)
+    if not image_list:
+        return 0
+    from PyPDF2 import PdfReader
+
+    pdf_bytes = img2pdf.convert(image_list)
+    with open(output_path, "wb") as pdf_file:
+        pdf_file.write(pdf_bytes)
+    # img2pdf embeds every frame of multi-frame images (GIF, TIFF) as a page
+    return len(PdfReader(io.BytesIO(pdf_bytes)).pages)
+
 
 def convert_images_to_pdf(
     image_directory: str,
     output_path: str = "output.pdf",
     image_formats: List[str] = None,
+    streaming: bool = False,
+    max_workers: int = 4,
+    compression: Optional[CompressionOptions] = None,
+    sort_files: bool = True,
 ) -> bool:
     """
     Convert all images in a directory to a single PDF file.
 
+    Pages are in natural filename order (page2 before page10).
+
     Args:
         image_directory: Path to directory containing images
         output_path: Path where PDF will be saved (default: output.pdf)
         image_formats: List of file extensions to process (default: ['png', 'jpg', 'jpeg'])
+        streaming: Write pages one at a time instead of building the whole
+            PDF in memory; invalid images are skipped
+        max_workers: Number of threads reading images in streaming mode
+        compression: Downscale/recompress images before writing them
+            (implies streaming)
+        sort_files: Sort the images; when False, pages follow directory
+            order and the streaming writer consumes the scan lazily
 
     Returns:
         bool: True if successful, False otherwise
@@ -57,31 +657,28 @@ def convert_images_to_pdf(
         raise ValueError(f"Image directory not found: {image_directory}")
 
     try:
-        # Get all image files
-        image_files = set()
-        for fmt in image_formats:
-            # Find files with lowercase extension
-            for file_path in Path(image_directory).glob(f"*.{fmt}"):
-                image_files.add(file_path)
-            # Find files with uppercase extension
-            for file_path in Path(image_directory).glob(f"*.{fmt.upper()}"):
-                image_files.add(file_path)
-
-        if not image_files:
-            logger.warning(f"No images found in {image_directory}")
-            return False
-
-        logger.info(f"Found {len(image_files)} images to convert")
-
-        # Convert images to PDF - sort by filename
-        image_list = [str(img) for img in sorted(image_files)]
+        if sort_files:
+            image_files = find_images(image_directory, image_formats)
+            if not image_files:
+                logger.warning(f"No images found in {image_directory}")
+                return False
+            logger.info(f"Found {len(image_files)} images to convert")
+        else:
+            # Feed the streaming writer straight from the directory scan
+            image_files = iter_images(image_directory, image_formats)
 
         # Ensure output directory exists
         output_file_path = Path(output_path)
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "wb") as pdf_file:
-            pdf_file.write(img2pdf.convert(image_list))
+        start = time.perf_counter()
+        pages = _write_pdf(
+            image_files, output_path, streaming, max_workers, compression
+        )
+        if not pages:
+            logger.warning(f"No valid images found in {image_directory}")
+            return False
+        _log_throughput(pages, time.perf_counter() - start, output_path)
 
         logger.info(f"PDF successfully created: {output_path}")
         return True
@@ -91,6 +688,159 @@ def convert_images_to_pdf(
         return False
 
 
+class FolderResult(NamedTuple):
+    """The outcome of converting one folder in a batch."""
+
+    folder: str
+    output_path: str
+    status: str
+    pages: int = 0
+    seconds: float = 0.0
+
+
+def _convert_folder(
+    folder: str,
+    image_names: List[str],
+    output_path: str,
+    streaming: bool,
+    compression: Optional[CompressionOptions] = None,
+) -> FolderResult:
+    """
+    Convert one folder's images to a PDF unless the PDF is up to date.
+
+    Runs in a worker process of convert_tree_to_pdfs.
+
+    Args:
+        folder: Directory containing the images
+        image_names: Names of the image files in the folder
+        output_path: Path where the folder's PDF will be saved
+        streaming: Whether to use the streaming writer
+        compression: Optional downscaling and recompression settings
+
+    Returns:
+        FolderResult: Status 'converted', 'skipped' or 'failed'
+    """
+    image_list = sorted(
+        (os.path.join(folder, name) for name in image_names), key=natural_sort_key
+    )
+    try:
+        newest_input = max(os.path.getmtime(path) for path in image_list)
+        if (
+            os.path.exists(output_path)
+            and os.path.getmtime(output_path) >= newest_input
+        ):
+            return FolderResult(folder, output_path, "skipped")
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        start = time.perf_counter()
+        # One process per folder already uses the cores; two threads are
+        # enough to overlap reading the next image with writing this one
+        pages = _write_pdf(
+            image_list, output_path, streaming, max_workers=2, compression=compression
+        )
+        seconds = time.perf_counter() - start
+    except Exception as e:
+        logger.error(f"Error converting {folder} to PDF: {str(e)}")
+        return FolderResult(folder, output_path, "failed")
+    if not pages:
+        return FolderResult(folder, output_path, "failed")
+    return FolderResult(folder, output_path, "converted", pages, seconds)
+
+
+def convert_tree_to_pdfs(
+    root_directory: str,
+    output_directory: str = "pdfs",
+    image_formats: List[str] = None,
+    streaming: bool = False,
+    max_workers: Optional[int] = None,
+    compression: Optional[CompressionOptions] = None,
+) -> List[FolderResult]:
+    """
+    Convert every folder of images under a directory to its own PDF.
+
+    Folders are converted in parallel on a process pool. The PDF for
+    root/a/b is written to output_directory/a/b.pdf; a folder is skipped when
+    its PDF is newer than all of its images.
+
+    Args:
+        root_directory: Directory tree containing image folders
+        output_directory: Directory where PDFs will be saved (default: pdfs)
+        image_formats: List of file extensions to process (default: ['png', 'jpg', 'jpeg'])
+        streaming: Whether to write pages one at a time
+        max_workers: Number of worker processes (default: number of CPUs)
+        compression: Optional downscaling and recompression settings
+
+    Returns:
+        List[FolderResult]: One result per folder containing images
+
+    Raises:
+        ValueError: If root_directory doesn't exist
+    """
+    if image_formats is None:
+        image_formats = ["png", "jpg", "jpeg"]
+    if not os.path.isdir(root_directory):
+        raise ValueError(f"Image directory not found: {root_directory}")
+
+    suffixes = _suffixes(image_formats)
+    root = os.path.abspath(root_directory)
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for folder, _, file_names in os.walk(root):
+            image_names = [
+                name for name in file_names if name.lower().endswith(suffixes)
+            ]
+            if not image_names:
+                continue
+            relative = os.path.relpath(folder, root)
+            if relative == ".":
+                relative = os.path.basename(root)
+            output_path = os.path.join(output_directory, f"{relative}.pdf")
+            futures.append(
+                executor.submit(
+                    _convert_folder,
+                    folder,
+                    image_names,
+                    output_path,
+                    streaming,
+                    compression,
+                )
+            )
+
+        for future in as_completed(futures):
+            result = future.result()
+            if result.status == "converted":
+                logger.info(
+                    f"Converted {result.folder} ({result.pages} pages, "
+                    f"{result.seconds:.2f}s) -> {result.output_path}"
+                )
+            results.append(result)
+
+    _log_batch_report(results, time.perf_counter() - start)
+    return results
+
+
+def _log_batch_report(results: List[FolderResult], seconds: float):
+    """Log the folder counts and aggregate throughput of a batch."""
+    counts = {
+        status: sum(result.status == status for result in results)
+        for status in ("converted", "skipped", "failed")
+    }
+    pages = sum(result.pages for result in results)
+    size = sum(
+        os.path.getsize(result.output_path)
+        for result in results
+        if result.status == "converted"
+    ) / (1024 * 1024)
+    logger.info(
+        f"Batch finished in {seconds:.2f}s: {counts['converted']} folders "
+        f"converted, {counts['skipped']} up to date, {counts['failed']} failed; "
+        f"{pages} pages, {size:.1f} MB ({pages / max(seconds, 1e-9):.1f} pages/sec, "
+        f"{counts['converted'] / max(seconds, 1e-9):.1f} folders/sec)"
+    )
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -107,6 +857,15 @@ Examples:
 
   # Convert images from specific directory
   python image2pdf.py --directory /path/to/images --output combined.pdf
+
+  # Stream thousands of scans to disk page by page
+  python image2pdf.py --directory ./scans --output scans.pdf --stream
+
+  # Shrink scans to 150 DPI JPEGs at quality 75
+  python image2pdf.py --directory ./scans --output small.pdf --dpi 150 --jpeg-quality 75
+
+  # Convert each folder under ./archive to pdfs/<folder>.pdf
+  python image2pdf.py --directory ./archive --recursive --output-dir pdfs
         """,
     )
     parser.add_argument(
@@ -122,10 +881,89 @@ Examples:
         help="Output PDF file path (default: output.pdf)",
     )
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write pages one at a time to keep memory low for large directories",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Threads reading images in streaming mode, or processes with "
+        "--recursive (default: 4)",
+    )
+    parser.add_argument(
+        "--unsorted",
+        action="store_true",
+        help="Keep directory order instead of sorting, so --stream can start "
+        "writing before the whole directory is scanned",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=float,
+        default=None,
+        help="Downscale images above this resolution (keeps the page size)",
+    )
+    parser.add_argument(
+        "--max-width",
+        type=int,
+        default=None,
+        help="Downscale images wider than this many pixels",
+    )
+    parser.add_argument(
+        "--max-height",
+        type=int,
+        default=None,
+        help="Downscale images taller than this many pixels",
+    )
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        default=None,
+        help="Recompress non-palette images as JPEG at this quality (1-95)",
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Convert every image folder under --directory to its own PDF",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="pdfs",
+        help="Directory for the PDFs in --recursive mode (default: pdfs)",
+    )
+
     args = parser.parse_args()
 
+    compression = None
+    if any(
+        value is not None
+        for value in (args.dpi, args.max_width, args.max_height, args.jpeg_quality)
+    ):
+        compression = CompressionOptions(
+            args.dpi, args.max_width, args.max_height, args.jpeg_quality
+        )
+
     try:
-        success = convert_images_to_pdf(args.directory, args.output)
+        if args.recursive:
+            results = convert_tree_to_pdfs(
+                args.directory,
+                args.output_dir,
+                streaming=args.stream,
+                max_workers=args.workers,
+                compression=compression,
+            )
+            exit(1 if any(result.status == "failed" for result in results) else 0)
+        success = convert_images_to_pdf(
+            args.directory,
+            args.output,
+            streaming=args.stream,
+            max_workers=args.workers,
+            compression=compression,
+            sort_files=not args.unsorted,
+        )
         exit(0 if success else 1)
     except ValueError as e:
         logger.error(f"Invalid input: {str(e)}")
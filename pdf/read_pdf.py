@@ -6,18 +6,37 @@ and optionally convert extracted text to speech.
 
 Features:
 - Extract text from single or multiple PDF pages
-- Text-to-speech conversion support
+- Parallel extraction of page ranges across processes
+- Page-by-page streaming API (iter_pdf_pages)
+- On-disk cache of extracted text, so unchanged PDFs are not parsed again
+- Text-to-speech conversion support, synthesized in parallel sentence chunks
 - Configurable voice selection
 - Error handling for corrupted PDFs
 - Support for multiple file dialog selections
+- Headless batch extraction of a directory of PDFs across processes
 - Logging support
 
 Usage:
     python read_pdf.py --file document.pdf --output audio.mp3
+    python read_pdf.py --directory papers --output-dir texts
 """
 
 import logging
+import multiprocessing
+import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
+import time
+import wave
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from text_cache import DEFAULT_CACHE_PATH, TextCache, page_content_hash
 
 FILE_PATH = "pdf/git-cheatsheet.pdf"
 
@@ -39,39 +58,272 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shorter documents are extracted in-process; starting a pool costs more
+PARALLEL_MIN_PAGES = 32
+# Page ranges per worker, so one slow range doesn't leave the others idle
+CHUNKS_PER_WORKER = 4
+# Caps how much text a worker holds before the consumer reads it
+MAX_PAGES_PER_CHUNK = 16
+# Frames copied at a time when joining audio segments
+AUDIO_BLOCK_FRAMES = 1 << 16
+# About a minute of speech per synthesized segment
+TTS_CHUNK_CHARS = 1000
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Text chunks extracted ahead of speech synthesis
+PIPELINE_QUEUE_CHUNKS = 32
+
+
+def parse_page_range(page_range: str, num_pages: int) -> List[int]:
+    """
+    Parse a page selection such as "1-5,8,10-" into 0-based page indexes.
+
+    Args:
+        page_range: Comma-separated 1-based pages and ranges; open ranges
+            run to the first or last page
+        num_pages: Number of pages in the document
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+    Returns:
+        List[int]: Page indexes in the order given
+
+    Raises:
+        ValueError: If the selection is malformed or outside the document
     """
-    Extract all text from a PDF file.
+    page_indexes = []
+    for part in page_range.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, separator, end = part.partition("-")
+        try:
+            first = int(start) if start else 1
+            last = (int(end) if end else num_pages) if separator else first
+        except ValueError:
+            raise ValueError(f"Invalid page range: {part}") from None
+        if not 1 <= first <= last <= num_pages:
+            raise ValueError(f"Page range {part} is outside pages 1-{num_pages}")
+        page_indexes.extend(range(first - 1, last))
+    return page_indexes
+
+
+def _extract_pages(pdf_path: str, page_indexes: List[int]) -> List[str]:
+    """
+    Extract the text of some pages.
+
+    Runs in a worker process, which opens the PDF itself so only the path and
+    page numbers are sent to it.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_indexes: 0-based indexes of the pages to extract
+
+    Returns:
+        List[str]: Text of each page
+    """
+    with open(pdf_path, "rb") as pdf_file:
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        return [pdf_reader.pages[index].extract_text() for index in page_indexes]
+
+
+def _chunk_pages(page_indexes: List[int], max_workers: int) -> List[List[int]]:
+    """Split page indexes into contiguous ranges for the worker processes."""
+    size = -(-len(page_indexes) // (max_workers * CHUNKS_PER_WORKER))
+    size = max(1, min(size, MAX_PAGES_PER_CHUNK))
+    return [
+        page_indexes[start : start + size]
+        for start in range(0, len(page_indexes), size)
+    ]
+
+
+def _map_ordered(
+    executor: Executor, func: Callable, args_list: Iterable[tuple], window: int
+) -> Iterator:
+    """
+    Run func(*args) for each args in an executor, yielding results in order.
+
+    At most `window` calls are pending at once, which bounds memory use.
+    """
+    pending = deque()
+    for args in args_list:
+        pending.append(executor.submit(func, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _mp_context():
+    """
+    Return the multiprocessing context to start worker processes with.
+
+    fork() only copies the calling thread, so a lock held by another thread
+    (logging, sqlite, ...) stays locked forever in the child. Workers are
+    spawned instead while other threads are running, e.g. when extraction
+    runs in the speech pipeline's producer thread.
+    """
+    if threading.active_count() > 1:
+        return multiprocessing.get_context("spawn")
+    return None
+
+
+def _iter_pages_parallel(
+    pdf_path: str, page_indexes: List[int], max_workers: int
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page number, text) in order while a process pool extracts ahead.
+
+    At most two page ranges per worker are in flight, which bounds memory.
+    """
+    chunks = _chunk_pages(page_indexes, max_workers)
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_mp_context())
+    try:
+        results = _map_ordered(
+            executor,
+            _extract_pages,
+            ((pdf_path, chunk) for chunk in chunks),
+            2 * max_workers,
+        )
+        for chunk, texts in zip(chunks, results):
+            yield from zip((index + 1 for index in chunk), texts)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _iter_page_indexes(
+    pdf_path: str, page_indexes: List[int], max_workers: int
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page number, text) for the given pages, in process or on a pool.
+    """
+    if max_workers > 1 and len(page_indexes) >= PARALLEL_MIN_PAGES:
+        yield from _iter_pages_parallel(pdf_path, page_indexes, max_workers)
+        return
+    if not page_indexes:
+        return
+    with open(pdf_path, "rb") as pdf_file:
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        for index in page_indexes:
+            yield index + 1, pdf_reader.pages[index].extract_text()
+
+
+def _iter_pages_cached(
+    pdf_path: str, page_range: Optional[str], max_workers: int, cache: TextCache
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page number, text), reading unchanged pages from the cache and
+    extracting (and caching) the rest.
+    """
+    digest = cache.file_digest(pdf_path)
+    page_hashes = cache.get_page_hashes(digest)
+    if page_hashes is None:
+        with open(pdf_path, "rb") as pdf_file:
+            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            memo = {}
+            page_hashes = [page_content_hash(page, memo) for page in pdf_reader.pages]
+        cache.put_page_hashes(digest, page_hashes)
+
+    page_indexes = _select_pages(page_range, len(page_hashes))
+    cached = cache.get_pages(page_hashes[index] for index in page_indexes)
+    missing = [index for index in page_indexes if page_hashes[index] not in cached]
+    logger.info(
+        f"Processing {len(page_indexes)} pages from {pdf_path} "
+        f"({len(page_indexes) - len(missing)} cached)"
+    )
+
+    extracted = _iter_page_indexes(pdf_path, missing, max_workers)
+    try:
+        for index in page_indexes:
+            page_hash = page_hashes[index]
+            if page_hash in cached:
+                yield index + 1, cached[page_hash]
+                continue
+            page_number, text = next(extracted)
+            cache.put_page(page_hash, text)
+            yield page_number, text
+    finally:
+        extracted.close()
+        cache.commit()
+
+
+def _select_pages(page_range: Optional[str], num_pages: int) -> List[int]:
+    """Return the 0-based indexes of the selected pages (default: all)."""
+    if page_range:
+        return parse_page_range(page_range, num_pages)
+    return list(range(num_pages))
+
+
+def iter_pdf_pages(
+    pdf_path: str,
+    page_range: Optional[str] = None,
+    max_workers: int = 1,
+    cache: Optional[TextCache] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield the text of a PDF one page at a time.
+
+    Pages are extracted as they are consumed, so callers can start on the
+    first page right away and memory does not grow with the document.
 
     Args:
         pdf_path: Path to the PDF file
+        page_range: Pages to extract, e.g. "1-5,8,10-" (default: all pages)
+        max_workers: Number of worker processes extracting ahead of the
+            consumer (1 extracts in this process)
+        cache: Text cache to read unchanged pages from and store new ones in
 
     Returns:
-        str: Extracted text from all pages
+        Iterator[Tuple[int, str]]: 1-based page number and text of each page
 
     Raises:
         FileNotFoundError: If PDF file doesn't exist
-        PyPDF2.utils.PdfReadError: If PDF is corrupted
+        ValueError: If page_range is invalid
     """
     if not Path(pdf_path).exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-    try:
-        extracted_text = ""
+    if cache is not None:
+        yield from _iter_pages_cached(pdf_path, page_range, max_workers, cache)
+        return
 
-        with open(pdf_path, "rb") as pdf_file:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            num_pages = len(pdf_reader.pages)
+    with open(pdf_path, "rb") as pdf_file:
+        num_pages = len(PyPDF2.PdfReader(pdf_file).pages)
+    page_indexes = _select_pages(page_range, num_pages)
+    logger.info(f"Processing {len(page_indexes)} pages from {pdf_path}")
+    yield from _iter_page_indexes(pdf_path, page_indexes, max_workers)
 
-            logger.info(f"Processing {num_pages} pages from {pdf_path}")
 
-            for page_num in range(num_pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                extracted_text += text + "\n"
-                logger.debug(f"Extracted page {page_num + 1}/{num_pages}")
+def extract_text_from_pdf(
+    pdf_path: str,
+    page_range: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache: Optional[TextCache] = None,
+) -> str:
+    """
+    Extract all text from a PDF file.
 
+    Long documents are split into page ranges that are extracted in parallel
+    by a process pool.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_range: Pages to extract, e.g. "1-5,8,10-" (default: all pages)
+        max_workers: Number of worker processes (default: number of CPUs;
+            1 extracts in this process)
+        cache: Text cache to read unchanged pages from and store new ones in
+
+    Returns:
+        str: Extracted text from the selected pages
+
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        ValueError: If page_range is invalid
+        PyPDF2.utils.PdfReadError: If PDF is corrupted
+    """
+    try:
+        pages = iter_pdf_pages(
+            pdf_path, page_range, max_workers or os.cpu_count() or 1, cache
+        )
+        extracted_text = "".join(f"{text}\n" for _, text in pages)
         logger.info(f"Successfully extracted {len(extracted_text)} characters")
         return extracted_text
 
@@ -80,36 +332,410 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         raise
 
 
+def iter_pdf_files(directory: str) -> Iterator[str]:
+    """
+    Yield the absolute paths of the PDF files under a directory, sorted.
+
+    Args:
+        directory: Directory to search recursively
+    """
+    for root, dirs, files in os.walk(os.path.abspath(directory)):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(".pdf"):
+                yield os.path.join(root, name)
+
+
+class FileResult(NamedTuple):
+    """The outcome of extracting one PDF in a batch."""
+
+    pdf_path: str
+    output_path: str
+    status: str
+    pages: int = 0
+    seconds: float = 0.0
+
+
+def _extract_file(
+    pdf_path: str,
+    output_path: str,
+    page_range: Optional[str],
+    cache_path: Optional[str],
+    cache_bytes: int,
+) -> FileResult:
+    """
+    Extract the text of one PDF to a text file.
+
+    Runs in a worker process of extract_directory.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_path: Path where the text will be saved
+        page_range: Pages to read, e.g. "1-5,8" (default: all pages)
+        cache_path: Text cache database, or None to always extract
+        cache_bytes: Maximum size of the cached text
+
+    Returns:
+        FileResult: Status 'extracted' or 'failed'
+    """
+    start = time.perf_counter()
+    cache = TextCache(cache_path, cache_bytes) if cache_path else None
+    tmp_path = f"{output_path}.tmp"
+    pages = 0
+    try:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        # One process per file already uses the cores
+        with open(tmp_path, "w", encoding="utf-8") as output:
+            for _, text in iter_pdf_pages(pdf_path, page_range, 1, cache):
+                output.write(f"{text}\n")
+                pages += 1
+        os.replace(tmp_path, output_path)
+    except Exception as e:
+        logger.error(f"Error extracting {pdf_path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return FileResult(pdf_path, output_path, "failed")
+    finally:
+        if cache:
+            cache.close()
+    return FileResult(
+        pdf_path, output_path, "extracted", pages, time.perf_counter() - start
+    )
+
+
+def extract_directory(
+    directory: str,
+    output_directory: str = "texts",
+    page_range: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+    cache_bytes: int = 256 * 1024 * 1024,
+) -> List[FileResult]:
+    """
+    Extract the text of every PDF under a directory to its own text file.
+
+    Files are extracted in parallel on a process pool, and each text file is
+    written as soon as its PDF is done. The text of root/a/b.pdf is written
+    to output_directory/a/b.txt.
+
+    Args:
+        directory: Directory tree containing PDF files
+        output_directory: Directory where text files will be saved
+        page_range: Pages to read from each file (default: all pages)
+        max_workers: Number of worker processes (default: number of CPUs)
+        cache_path: Text cache database shared by the workers, or None to
+            always extract
+        cache_bytes: Maximum size of the cached text
+
+    Returns:
+        List[FileResult]: One result per PDF file
+
+    Raises:
+        ValueError: If directory doesn't exist
+    """
+    if not os.path.isdir(directory):
+        raise ValueError(f"PDF directory not found: {directory}")
+
+    root = os.path.abspath(directory)
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _extract_file,
+                pdf_path,
+                os.path.join(
+                    output_directory,
+                    str(Path(os.path.relpath(pdf_path, root)).with_suffix(".txt")),
+                ),
+                page_range,
+                cache_path,
+                cache_bytes,
+            )
+            for pdf_path in iter_pdf_files(root)
+        ]
+
+        for future in as_completed(futures):
+            result = future.result()
+            if result.status == "extracted":
+                logger.info(
+                    f"Extracted {result.pdf_path} ({result.pages} pages, "
+                    f"{result.seconds:.2f}s) -> {result.output_path}"
+                )
+            results.append(result)
+
+    _log_batch_report(results, time.perf_counter() - start)
+    return results
+
+
+def _log_batch_report(results: List[FileResult], seconds: float):
+    """Log the file counts and aggregate throughput of a batch."""
+    extracted = sum(result.status == "extracted" for result in results)
+    pages = sum(result.pages for result in results)
+    logger.info(
+        f"Batch finished in {seconds:.2f}s: {extracted} files extracted, "
+        f"{len(results) - extracted} failed; {pages} pages "
+        f"({pages / max(seconds, 1e-9):.1f} pages/sec, "
+        f"{extracted / max(seconds, 1e-9):.1f} files/sec)"
+    )
+
+
+def _init_engine(voice_index: int = 0, rate: int = 150):
+    """
+    Create a text-to-speech engine.
+
+    Args:
+        voice_index: Index of voice to use (0=default)
+        rate: Speech rate in words per minute
+
+    Returns:
+        pyttsx3.Engine: The configured engine
+    """
+    engine = pyttsx3.init()
+
+    # Set voice properties
+    voices = engine.getProperty("voices")
+    if voice_index < len(voices):
+        engine.setProperty("voice", voices[voice_index].id)
+
+    engine.setProperty("rate", rate)
+    return engine
+
+
+def split_text(text: str, max_chars: int = TTS_CHUNK_CHARS) -> Iterator[str]:
+    """
+    Split text into chunks of whole sentences for speech synthesis.
+
+    Chunks end at paragraph breaks once they are at least half full, and
+    sentences longer than max_chars are split between words.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        Iterator[str]: Chunks with whitespace (e.g. PDF line breaks) collapsed
+    """
+    chunk = ""
+    for paragraph in PARAGRAPH_BREAK.split(text):
+        for sentence in SENTENCE_END.split(paragraph):
+            sentence = " ".join(sentence.split())
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                if chunk:
+                    yield chunk
+                    chunk = ""
+                yield sentence[:cut]
+                sentence = sentence[cut:].lstrip()
+            if not sentence:
+                continue
+            if chunk and len(chunk) + 1 + len(sentence) > max_chars:
+                yield chunk
+                chunk = sentence
+            else:
+                chunk = f"{chunk} {sentence}" if chunk else sentence
+        if len(chunk) >= max_chars // 2:
+            yield chunk
+            chunk = ""
+    if chunk:
+        yield chunk
+
+
+# The engine of a synthesis worker process, created by _init_tts_worker
+_tts_engine = None
+
+
+def _init_tts_worker(voice_index: int, rate: int):
+    """Create the text-to-speech engine of a worker process."""
+    global _tts_engine
+    _tts_engine = _init_engine(voice_index, rate)
+
+
+def _synthesize_chunk(text: str, segment_path: str) -> Optional[str]:
+    """
+    Synthesize one chunk of text to an audio segment.
+
+    Runs in a worker process; a failure only loses this segment.
+
+    Args:
+        text: Text to speak
+        segment_path: Path where the segment will be saved
+
+    Returns:
+        Optional[str]: segment_path, or None if synthesis failed
+    """
+    try:
+        _tts_engine.save_to_file(text, segment_path)
+        _tts_engine.runAndWait()
+        if not os.path.exists(segment_path):
+            raise IOError("the engine did not write the segment")
+        return segment_path
+    except Exception as e:
+        logger.error(f"Error synthesizing {segment_path}: {str(e)}")
+        return None
+
+
+def synthesize_chunks(
+    chunks: Iterable[str],
+    segment_dir: str,
+    voice_index: int = 0,
+    rate: int = 150,
+    max_workers: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Synthesize text chunks to numbered audio segments on a process pool.
+
+    Each worker process has its own engine. Segments are yielded in order as
+    they are ready, while later chunks are still being synthesized. Workers
+    are spawned rather than forked, since chunks may come from a producer
+    thread that is already running.
+
+    Args:
+        chunks: Text chunks in reading order
+        segment_dir: Directory where segments 00001.wav, 00002.wav, ... are saved
+        voice_index: Index of voice to use (0=default)
+        rate: Speech rate in words per minute
+        max_workers: Number of synthesis processes (default: number of CPUs)
+
+    Returns:
+        Iterator[str]: Paths of the synthesized segments; failed chunks are
+        skipped
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_tts_worker,
+        initargs=(voice_index, rate),
+    ) as executor:
+        jobs = (
+            (chunk, os.path.join(segment_dir, f"{number:05d}.wav"))
+            for number, chunk in enumerate(chunks, start=1)
+        )
+        for segment_path in _map_ordered(
+            executor, _synthesize_chunk, jobs, 2 * max_workers
+        ):
+            if segment_path is not None:
+                logger.info(f"Audio segment ready: {segment_path}")
+                yield segment_path
+
+
+def _prefetch(items: Iterable, maxsize: int) -> Iterator:
+    """
+    Iterate over items in a background thread, staying up to maxsize items
+    ahead of the consumer.
+
+    Exceptions raised by items are re-raised in the consumer. Closing the
+    returned iterator stops the background thread.
+    """
+    buffer = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put((True, item)):
+                    return
+            put((False, None))
+        except Exception as e:
+            put((False, e))
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            has_item, value = buffer.get()
+            if not has_item:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _speak_chunks(
+    chunks: Iterable[str],
+    output_file: str,
+    voice_index: int,
+    rate: int,
+    max_workers: Optional[int],
+    segment_dir: Optional[str],
+) -> bool:
+    """
+    Synthesize chunks to segments and join them into output_file.
+
+    Returns:
+        bool: True if any audio was produced
+    """
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        segment_dir = segment_dir or tmp_dir
+        os.makedirs(segment_dir, exist_ok=True)
+        segment_paths = []
+        for segment_path in synthesize_chunks(
+            chunks, segment_dir, voice_index, rate, max_workers
+        ):
+            if not segment_paths:
+                logger.info(
+                    f"First audio segment after {time.perf_counter() - start:.2f}s"
+                )
+            segment_paths.append(segment_path)
+        if not segment_paths:
+            return False
+        concatenate_audio(segment_paths, output_file)
+    return True
+
+
 def convert_text_to_speech(
-    text: str, output_file: str = "audio.mp3", voice_index: int = 0, rate: int = 150
+    text: str,
+    output_file: str = "audio.mp3",
+    voice_index: int = 0,
+    rate: int = 150,
+    max_workers: Optional[int] = None,
+    segment_dir: Optional[str] = None,
 ) -> bool:
     """
     Convert text to speech and save to audio file.
 
+    The text is split into sentence chunks that are synthesized in parallel
+    and joined, so a failed chunk doesn't lose the rest of the audio.
+
     Args:
         text: Text to convert to speech
         output_file: Path where audio file will be saved
         voice_index: Index of voice to use (0=default)
         rate: Speech rate in words per minute
+        max_workers: Number of synthesis processes (default: number of CPUs)
+        segment_dir: Directory to keep the numbered segments in (default: a
+            temporary directory)
 
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        engine = pyttsx3.init()
-
-        # Set voice properties
-        voices = engine.getProperty("voices")
-        if voice_index < len(voices):
-            engine.setProperty("voice", voices[voice_index].id)
-
-        engine.setProperty("rate", rate)
-
         logger.info(f"Converting text to speech ({len(text)} characters)")
 
-        # Save to file
-        engine.save_to_file(text, output_file)
-        engine.runAndWait()
+        if not _speak_chunks(
+            split_text(text), output_file, voice_index, rate, max_workers, segment_dir
+        ):
+            logger.error("No audio was produced")
+            return False
 
         logger.info(f"Audio saved to: {output_file}")
         return True
@@ -119,16 +745,74 @@ def convert_text_to_speech(
         return False
 
 
+def concatenate_audio(segment_paths: List[str], output_file: str):
+    """
+    Join audio segments into one file.
+
+    The segments must be WAV files with the same format, which is what the
+    pyttsx3 drivers write on Windows and Linux whatever the file extension.
+    Other formats (e.g. AIFF on macOS) are kept as numbered files next to
+    output_file instead.
+
+    Args:
+        segment_paths: Segment files in playback order
+        output_file: Path where the joined audio will be saved
+    """
+    try:
+        with wave.open(segment_paths[0], "rb") as first_segment:
+            params = first_segment.getparams()
+        with wave.open(output_file, "wb") as output:
+            output.setparams(params)
+            for path in segment_paths:
+                with wave.open(path, "rb") as segment:
+                    while frames := segment.readframes(AUDIO_BLOCK_FRAMES):
+                        output.writeframes(frames)
+    except wave.Error:
+        output_path = Path(output_file)
+        for number, path in enumerate(segment_paths, start=1):
+            shutil.copyfile(
+                path,
+                output_path.with_name(
+                    f"{output_path.stem}_{number:04d}{output_path.suffix}"
+                ),
+            )
+        logger.warning(
+            f"Audio segments are not WAV files; saved them as "
+            f"{output_path.stem}_NNNN{output_path.suffix} instead"
+        )
+
+
 def process_pdf_to_speech(
-    pdf_path: str, output_file: str = "output.mp3", voice_index: int = 0
+    pdf_path: str,
+    output_file: str = "output.mp3",
+    voice_index: int = 0,
+    page_range: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache: Optional[TextCache] = None,
+    tts_workers: Optional[int] = None,
+    segment_dir: Optional[str] = None,
 ) -> bool:
     """
     Extract text from PDF and convert to speech.
 
+    Extraction and synthesis run as a pipeline: a background thread streams
+    pages from the PDF and splits them into sentence chunks, which pass
+    through a bounded queue to a process pool that synthesizes them to
+    numbered segments. Extraction keeps going while the synthesizers are
+    busy, and stops when the queue is full, so memory stays bounded. The
+    segments are joined at the end.
+
     Args:
         pdf_path: Path to PDF file
         output_file: Path for output audio file
         voice_index: Index of voice to use
+        page_range: Pages to read, e.g. "1-5,8" (default: all pages)
+        max_workers: Number of text extraction processes (default: number
+            of CPUs)
+        cache: Text cache to read unchanged pages from and store new ones in
+        tts_workers: Number of synthesis processes (default: number of CPUs)
+        segment_dir: Directory to keep the numbered segments in (default: a
+            temporary directory)
 
     Returns:
         bool: True if successful, False otherwise
@@ -136,20 +820,22 @@ def process_pdf_to_speech(
     try:
         logger.info(f"Starting PDF to speech conversion: {pdf_path}")
 
-        # Extract text
-        text = extract_text_from_pdf(pdf_path)
-
-        if not text.strip():
+        pages = iter_pdf_pages(
+            pdf_path, page_range, max_workers or os.cpu_count() or 1, cache
+        )
+        chunks = _prefetch(
+            (chunk for _, text in pages for chunk in split_text(text)),
+            PIPELINE_QUEUE_CHUNKS,
+        )
+        if not _speak_chunks(
+            chunks, output_file, voice_index, 150, tts_workers, segment_dir
+        ):
             logger.warning("No text extracted from PDF")
             return False
 
-        # Convert to speech
-        success = convert_text_to_speech(text, output_file, voice_index)
-
-        if success:
-            logger.info("PDF to speech conversion completed successfully")
-
-        return success
+        logger.info(f"Audio saved to: {output_file}")
+        logger.info("PDF to speech conversion completed successfully")
+        return True
 
     except Exception as e:
         logger.error(f"Error in PDF to speech conversion: {str(e)}")
@@ -158,15 +844,26 @@ def process_pdf_to_speech(
 
 if __name__ == "__main__":
     import argparse
-    from tkinter.filedialog import askopenfilename
-    import tkinter as tk
 
     parser = argparse.ArgumentParser(
         description="Extract text from PDF and convert to speech"
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
         "--file", type=str, help="PDF file path (if not provided, shows file dialog)"
     )
+    source.add_argument(
+        "--directory",
+        type=str,
+        help="Extract the text of every PDF under this directory, without a "
+        "dialog or speech",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="texts",
+        help="Where --directory writes the text files (default: texts)",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -176,14 +873,75 @@ if __name__ == "__main__":
     parser.add_argument(
         "--voice", type=int, default=0, help="Voice index to use (default: 0)"
     )
+    parser.add_argument(
+        "--pages",
+        type=str,
+        default=None,
+        help='Pages to read, e.g. "1-5,8,10-" (default: all pages)',
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Text extraction processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--tts-workers",
+        type=int,
+        default=None,
+        help="Speech synthesis processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--segments",
+        type=str,
+        default=None,
+        help="Directory to keep the numbered audio segments in as they are "
+        "synthesized (default: a temporary directory)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=DEFAULT_CACHE_PATH,
+        help=f"Extracted text cache (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="Maximum size of the cached text in MB (default: 256)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always extract the text from the PDF",
+    )
 
     args = parser.parse_args()
 
+    if args.directory:
+        try:
+            results = extract_directory(
+                args.directory,
+                args.output_dir,
+                args.pages,
+                args.workers,
+                None if args.no_cache else args.cache,
+                args.cache_size * 1024 * 1024,
+            )
+        except ValueError as e:
+            logger.error(str(e))
+            exit(1)
+        failed = any(result.status == "failed" for result in results)
+        exit(1 if failed or not results else 0)
+
     # Get PDF file path
     if args.file:
         pdf_file = args.file
     else:
-        # Show file dialog
+        # Show file dialog; tkinter is only needed (and available) on desktops
+        import tkinter as tk
+        from tkinter.filedialog import askopenfilename
+
         root = tk.Tk()
         root.withdraw()
         pdf_file = askopenfilename(
@@ -193,7 +951,21 @@ if __name__ == "__main__":
         root.destroy()
 
     if pdf_file:
-        success = process_pdf_to_speech(pdf_file, args.output, args.voice)
+        cache = (
+            None
+            if args.no_cache
+            else TextCache(args.cache, args.cache_size * 1024 * 1024)
+        )
+        success = process_pdf_to_speech(
+            pdf_file,
+            args.output,
+            args.voice,
+            args.pages,
+            args.workers,
+            cache,
+            tts_workers=args.tts_workers,
+            segment_dir=args.segments,
+        )
         exit(0 if success else 1)
     else:
         logger.warning("No PDF file selected")
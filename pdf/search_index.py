@@ -0,0 +1,281 @@
+"""
+Full-text search over the pages of a directory of PDF files.
+
+Page text is extracted with read_pdf and stored in a SQLite FTS5 index, so
+queries return matching documents and page numbers in milliseconds instead
+of re-reading the PDFs. Updating the index only extracts files whose size or
+modification time changed, and drops files that were deleted.
+
+Usage:
+    python search_index.py index ~/papers
+    python search_index.py query 'NEAR(merge conflict, 5)'
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from read_pdf import iter_pdf_files, iter_pdf_pages
+from text_cache import TextCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "read_pdf", "search_index.sqlite3"
+)
+# Words of context around the matches in a snippet
+SNIPPET_WORDS = 12
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    pages INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL,
+    page INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_document ON pages (document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+    text, content='pages', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS pages_insert AFTER INSERT ON pages BEGIN
+    INSERT INTO pages_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS pages_delete AFTER DELETE ON pages BEGIN
+    INSERT INTO pages_fts (pages_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+class SearchHit(NamedTuple):
+    """A page matching a query."""
+
+    path: str
+    page: int
+    snippet: str
+    score: float
+
+
+class IndexStats(NamedTuple):
+    """What an index update did."""
+
+    indexed: int
+    unchanged: int
+    removed: int
+    failed: int
+    pages: int
+
+
+class SearchIndex:
+    """Page-level full-text index of PDF files."""
+
+    def __init__(self, index_path: str = DEFAULT_INDEX_PATH):
+        """
+        Open (or create) an index database.
+
+        Args:
+            index_path: Path to the SQLite database file
+        """
+        Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+        self.index_path = index_path
+        self.connection = sqlite3.connect(index_path, timeout=30)
+        self.connection.executescript(SCHEMA)
+
+    def _remove_document(self, document_id: int):
+        """Delete a document and its pages; call within a transaction."""
+        self.connection.execute(
+            "DELETE FROM pages WHERE document_id = ?", (document_id,)
+        )
+        self.connection.execute("DELETE FROM documents WHERE id = ?", (document_id,))
+
+    def add_document(
+        self,
+        pdf_path: str,
+        max_workers: int = 1,
+        cache: Optional[TextCache] = None,
+    ) -> int:
+        """
+        Extract a PDF and replace its pages in the index.
+
+        Args:
+            pdf_path: Path to the PDF file
+            max_workers: Number of text extraction processes
+            cache: Text cache to read unchanged pages from and store new ones in
+
+        Returns:
+            int: Number of pages indexed
+        """
+        path = os.path.abspath(pdf_path)
+        stat = os.stat(path)
+        pages = list(iter_pdf_pages(path, max_workers=max_workers, cache=cache))
+
+        # One transaction per document, so an interrupted update never leaves
+        # a document half indexed
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT id FROM documents WHERE path = ?", (path,)
+            ).fetchone()
+            if row:
+                self._remove_document(row[0])
+            document_id = self.connection.execute(
+                "INSERT INTO documents (path, size, mtime_ns, pages) "
+                "VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, len(pages)),
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO pages (document_id, page, text) VALUES (?, ?, ?)",
+                ((document_id, page, text) for page, text in pages),
+            )
+        return len(pages)
+
+    def update(
+        self,
+        directory: str,
+        max_workers: int = 1,
+        cache: Optional[TextCache] = None,
+    ) -> IndexStats:
+        """
+        Bring the index up to date with the PDF files under a directory.
+
+        Files are re-extracted only if their size or modification time
+        changed; files that no longer exist are removed from the index.
+
+        Args:
+            directory: Directory to index recursively
+            max_workers: Number of text extraction processes per file
+            cache: Text cache to read unchanged pages from and store new ones in
+
+        Returns:
+            IndexStats: Counts of indexed, unchanged, removed and failed files
+        """
+        root = os.path.join(os.path.abspath(directory), "")
+        known = {
+            path: (document_id, size, mtime_ns)
+            for document_id, path, size, mtime_ns in self.connection.execute(
+                "SELECT id, path, size, mtime_ns FROM documents "
+                "WHERE substr(path, 1, ?) = ?",
+                (len(root), root),
+            )
+        }
+
+        indexed = unchanged = failed = pages = 0
+        for path in iter_pdf_files(directory):
+            entry = known.pop(path, None)
+            stat = os.stat(path)
+            if entry and entry[1:] == (stat.st_size, stat.st_mtime_ns):
+                unchanged += 1
+                continue
+            try:
+                pages += self.add_document(path, max_workers, cache)
+                indexed += 1
+                logger.info(f"Indexed {path}")
+            except Exception as e:
+                failed += 1
+                logger.error(f"Error indexing {path}: {str(e)}")
+
+        with self.connection:
+            for document_id, _, _ in known.values():
+                self._remove_document(document_id)
+        if known:
+            logger.info(f"Removed {len(known)} deleted files from the index")
+        return IndexStats(indexed, unchanged, len(known), failed, pages)
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        """
+        Find the pages matching a query, best matches first.
+
+        Args:
+            query: FTS5 query, e.g. 'rebase', '"merge conflict"', 'git AND
+                stash' or 'branch*'
+            limit: Maximum number of hits
+
+        Returns:
+            List[SearchHit]: Matching pages ranked by BM25
+
+        Raises:
+            sqlite3.OperationalError: If the query is not valid FTS5 syntax
+        """
+        rows = self.connection.execute(
+            "SELECT documents.path, pages.page, "
+            "snippet(pages_fts, 0, '[', ']', '...', ?), pages_fts.rank "
+            "FROM pages_fts "
+            "JOIN pages ON pages.id = pages_fts.rowid "
+            "JOIN documents ON documents.id = pages.document_id "
+            "WHERE pages_fts MATCH ? ORDER BY pages_fts.rank LIMIT ?",
+            (SNIPPET_WORDS, query, limit),
+        )
+        return [
+            SearchHit(path, page, " ".join(snippet.split()), score)
+            for path, page, snippet, score in rows
+        ]
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from text_cache import DEFAULT_CACHE_PATH
+
+    parser = argparse.ArgumentParser(description="Full-text search over PDF files")
+    parser.add_argument(
+        "--index",
+        type=str,
+        default=DEFAULT_INDEX_PATH,
+        help=f"Index database (default: {DEFAULT_INDEX_PATH})",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    index_parser = subparsers.add_parser(
+        "index", help="Add or update the PDF files under a directory"
+    )
+    index_parser.add_argument("directory", type=str, help="Directory of PDF files")
+    index_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Text extraction processes (default: number of CPUs)",
+    )
+    index_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't use the extracted text cache ({DEFAULT_CACHE_PATH})",
+    )
+    query_parser = subparsers.add_parser("query", help="Search the index")
+    query_parser.add_argument("query", type=str, help="FTS5 query")
+    query_parser.add_argument(
+        "--limit", type=int, default=20, help="Maximum number of hits (default: 20)"
+    )
+    args = parser.parse_args()
+
+    index = SearchIndex(args.index)
+    start = time.perf_counter()
+    if args.command == "index":
+        cache = None if args.no_cache else TextCache()
+        stats = index.update(args.directory, args.workers or os.cpu_count() or 1, cache)
+        if cache:
+            cache.close()
+        print(
+            f"Indexed {stats.indexed} files ({stats.pages} pages), "
+            f"{stats.unchanged} unchanged, {stats.removed} removed, "
+            f"{stats.failed} failed in {time.perf_counter() - start:.1f}s"
+        )
+    else:
+        try:
+            hits = index.search(args.query, args.limit)
+        except sqlite3.OperationalError as e:
+            parser.error(f"invalid query: {e}")
+        for hit in hits:
+            print(f"{hit.path}:{hit.page}: {hit.snippet}")
+        print(f"{len(hits)} hits in {(time.perf_counter() - start) * 1000:.1f} ms")
+    index.close()
@@ -0,0 +1,83 @@
+"""
+Regression tests for the extracted text cache.
+
+Run with:
+    python -m unittest test_text_cache
+"""
+
+import os
+import tempfile
+import unittest
+
+from read_pdf import extract_text_from_pdf
+from text_cache import TextCache
+
+
+def write_form_xobject_pdf(path: str, text: str):
+    """
+    Write a one-page PDF whose page only draws a form XObject.
+
+    The page content stream is the same for every text ("q /Fm0 Do Q"); the
+    text itself lives in the form XObject, as in many generated PDFs.
+    """
+    form = f"BT /F1 24 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    page_content = b"q /Fm0 Do Q"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /XObject << /Fm0 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(page_content), page_content),
+        b"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 6 0 R >> >> /Length %d >>\nstream\n%s\nendstream"
+        % (len(form), form),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    with open(path, "wb") as pdf_file:
+        pdf_file.write(data)
+
+
+class TextCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = TextCache(os.path.join(self.tmp_dir.name, "cache.sqlite3"))
+        self.addCleanup(self.cache.close)
+
+    def test_pages_drawing_different_form_xobjects_are_cached_separately(self):
+        apples = os.path.join(self.tmp_dir.name, "a.pdf")
+        bananas = os.path.join(self.tmp_dir.name, "b.pdf")
+        write_form_xobject_pdf(apples, "Apples")
+        write_form_xobject_pdf(bananas, "Bananas")
+
+        self.assertIn("Apples", extract_text_from_pdf(apples, cache=self.cache))
+        text = extract_text_from_pdf(bananas, cache=self.cache)
+        self.assertIn("Bananas", text)
+        self.assertNotIn("Apples", text)
+
+    def test_identical_pages_are_read_from_the_cache(self):
+        first = os.path.join(self.tmp_dir.name, "first.pdf")
+        copy = os.path.join(self.tmp_dir.name, "copy.pdf")
+        write_form_xobject_pdf(first, "Apples")
+        write_form_xobject_pdf(copy, "Apples")
+        extract_text_from_pdf(first, cache=self.cache)
+
+        with self.assertLogs("read_pdf", "INFO") as logs:
+            self.assertIn("Apples", extract_text_from_pdf(copy, cache=self.cache))
+        self.assertTrue(any("(1 cached)" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
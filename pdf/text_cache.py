@@ -0,0 +1,310 @@
+"""
+On-disk cache of text extracted from PDF files.
+
+Text is stored per page in a SQLite database, keyed by a hash of the page's
+content streams and the resources they use (form XObjects, fonts), so
+unchanged documents are read back without parsing the PDF and an edited
+document only re-extracts the pages that changed.
+
+Documents are identified by a SHA-256 hash of the file. The hash is only
+recomputed when a file's size or modification time changes.
+
+Usage:
+    from text_cache import TextCache
+
+    cache = TextCache()
+    text = extract_text_from_pdf("document.pdf", cache=cache)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "read_pdf", "text_cache.sqlite3"
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+HASH_BLOCK_SIZE = 1 << 20
+# Bumped when page hashes change meaning; older caches are cleared on open
+SCHEMA_VERSION = 2
+# Back-references that would pull the whole page tree into a page's hash
+SKIPPED_KEYS = {"/Parent", "/P"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    digest TEXT PRIMARY KEY,
+    page_hashes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    page_hash TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_last_used ON pages (last_used);
+"""
+
+
+def _object_digest(obj, memo: Dict) -> bytes:
+    """
+    Hash a PDF object and everything it references.
+
+    Args:
+        obj: PyPDF2 object
+        memo: Digests of the indirect objects hashed so far, by reference;
+            shared between the pages of a document so shared fonts and
+            XObjects are only hashed once
+
+    Returns:
+        bytes: SHA-256 digest
+    """
+    if isinstance(obj, IndirectObject):
+        key = (obj.idnum, obj.generation)
+        if key not in memo:
+            # Stands in for the object while it is being hashed, in case it
+            # refers back to itself
+            memo[key] = hashlib.sha256(f"ref {key}".encode()).digest()
+            memo[key] = _object_digest(obj.get_object(), memo)
+        return memo[key]
+
+    digest = hashlib.sha256()
+    if isinstance(obj, DictionaryObject):
+        digest.update(b"dict")
+        for name in sorted(obj):
+            if name not in SKIPPED_KEYS:
+                digest.update(name.encode("utf-8"))
+                digest.update(_object_digest(obj.raw_get(name), memo))
+        # Image data doesn't affect the text
+        if isinstance(obj, StreamObject) and obj.get("/Subtype") != "/Image":
+            digest.update(b"stream")
+            digest.update(obj.get_data())
+    elif isinstance(obj, ArrayObject):
+        digest.update(b"array")
+        for item in obj:
+            digest.update(_object_digest(item, memo))
+    else:
+        digest.update(repr(obj).encode("utf-8"))
+    return digest.digest()
+
+
+def page_content_hash(page, memo: Optional[Dict] = None) -> str:
+    """
+    Hash everything that determines the text of a PDF page.
+
+    That is the page's content streams and resources (following form
+    XObjects, fonts and their ToUnicode maps) and its rotation. Hashing the
+    content streams alone isn't enough: pages that only draw a form XObject
+    ("q /Fm0 Do Q") have identical content streams.
+
+    Args:
+        page: PyPDF2 page object
+        memo: Digests of indirect objects shared between the pages of a
+            document (see _object_digest)
+
+    Returns:
+        str: Hex digest that changes when the page's text can change
+    """
+    memo = {} if memo is None else memo
+    resources = page.raw_get("/Resources") if "/Resources" in page else None
+    node = page
+    # Resources may be inherited from the page tree
+    while resources is None and "/Parent" in node:
+        node = node["/Parent"]
+        resources = node.raw_get("/Resources") if "/Resources" in node else None
+
+    digest = hashlib.sha256()
+    for name, obj in (
+        ("/Contents", page.raw_get("/Contents") if "/Contents" in page else None),
+        ("/Resources", resources),
+        ("/Rotate", page.get("/Rotate")),
+    ):
+        digest.update(name.encode("utf-8"))
+        if obj is not None:
+            digest.update(_object_digest(obj, memo))
+    return digest.hexdigest()
+
+
+class TextCache:
+    """
+    Cache extracted page text on disk with a size limit.
+
+    When the stored text grows past max_bytes, the least recently used pages
+    are evicted.
+    """
+
+    def __init__(
+        self, cache_path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Open (or create) a cache database.
+
+        Args:
+            cache_path: Path to the SQLite database file
+            max_bytes: Maximum total size of the cached text
+        """
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        # Batch runs may share the cache across processes, and the speech
+        # pipeline uses it from its extraction thread
+        self.connection = sqlite3.connect(
+            cache_path, timeout=30, check_same_thread=False
+        )
+        self.connection.executescript(SCHEMA)
+        self._upgrade()
+
+    def _upgrade(self):
+        """Clear a cache written with older page hashes, which can collide."""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with self.connection:
+                self.connection.execute("DELETE FROM documents")
+                self.connection.execute("DELETE FROM pages")
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def file_digest(self, pdf_path: str) -> str:
+        """
+        Return the SHA-256 of a file, reusing the stored hash while the file's
+        size and modification time are unchanged.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            str: Hex digest of the file contents
+        """
+        path = os.path.abspath(pdf_path)
+        stat = os.stat(path)
+        row = self.connection.execute(
+            "SELECT digest FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns),
+        ).fetchone()
+        if row:
+            return row[0]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as pdf_file:
+            while block := pdf_file.read(HASH_BLOCK_SIZE):
+                digest.update(block)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+            (path, stat.st_size, stat.st_mtime_ns, digest.hexdigest()),
+        )
+        self.connection.commit()
+        return digest.hexdigest()
+
+    def get_page_hashes(self, digest: str) -> Optional[List[str]]:
+        """
+        Return the content hashes of a document's pages, if known.
+
+        Args:
+            digest: File digest from file_digest
+        """
+        row = self.connection.execute(
+            "SELECT page_hashes FROM documents WHERE digest = ?", (digest,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_page_hashes(self, digest: str, page_hashes: List[str]):
+        """
+        Store the content hashes of a document's pages.
+
+        Args:
+            digest: File digest from file_digest
+            page_hashes: Content hash of every page, in page order
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO documents VALUES (?, ?)",
+            (digest, json.dumps(page_hashes)),
+        )
+        self.connection.commit()
+
+    def get_pages(self, page_hashes: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up cached page text and mark it as recently used.
+
+        Args:
+            page_hashes: Content hashes of the pages to look up
+
+        Returns:
+            Dict[str, str]: Text of the cached pages, by content hash
+        """
+        page_hashes = list(set(page_hashes))
+        texts = {}
+        # Stay under SQLite's limit on query parameters
+        for start in range(0, len(page_hashes), 500):
+            batch = page_hashes[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            texts.update(
+                self.connection.execute(
+                    f"SELECT page_hash, text FROM pages "
+                    f"WHERE page_hash IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            )
+            self.connection.execute(
+                f"UPDATE pages SET last_used = ? WHERE page_hash IN ({placeholders})",
+                [time.time(), *batch],
+            )
+        self.connection.commit()
+        return texts
+
+    def put_page(self, page_hash: str, text: str):
+        """
+        Store the text of one page; call commit() to save it.
+
+        Args:
+            page_hash: Content hash of the page
+            text: Extracted text
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+            (page_hash, text, len(text.encode("utf-8")), time.time()),
+        )
+
+    def commit(self):
+        """Save stored pages and evict old ones if the cache is too large."""
+        self.connection.commit()
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used pages until the cache fits max_bytes."""
+        total = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM pages"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = self.connection.execute(
+            "SELECT page_hash, size FROM pages ORDER BY last_used"
+        ).fetchall()
+        for page_hash, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.connection.execute(
+                "DELETE FROM pages WHERE page_hash = ?", (page_hash,)
+            )
+            total -= size
+            evicted += 1
+        self.connection.commit()
+        logger.info(f"Evicted {evicted} pages from the text cache")
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
@@ -0,0 +1,137 @@
+"""
+Benchmarks for the OCR utilities.
+
+Synthetic image directories are built by copying the bundled sample images.
+
+Usage:
+    python benchmark.py workers --images 300 --workers 4
+    python benchmark.py backends --images 300 --workers 4
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import image_to_text
+from image_to_text import extract_text_from_directory
+
+SAMPLE_IMAGES = sorted(
+    path
+    for path in Path(__file__).parent.iterdir()
+    if path.suffix.lower() in {".jpg", ".jpeg", ".png"}
+)
+
+
+def build_image_directory(directory: str, images: int):
+    """
+    Fill a directory with copies of the sample images.
+
+    Args:
+        directory: Directory where the images will be copied
+        images: Number of image files to write
+    """
+    for index in range(images):
+        sample = SAMPLE_IMAGES[index % len(SAMPLE_IMAGES)]
+        shutil.copyfile(sample, os.path.join(directory, f"{index:05d}{sample.suffix}"))
+
+
+def benchmark_workers(images: int, workers: int):
+    """
+    Time sequential OCR of a directory against a thread pool.
+
+    Args:
+        images: Number of images in the synthetic directory
+        workers: Number of threads for the parallel case
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        build_image_directory(tmp_dir, images)
+
+        results = {}
+        for name, count in (("sequential", 1), (f"{workers} workers", workers)):
+            start = time.perf_counter()
+            results[name] = extract_text_from_directory(tmp_dir, workers=count)
+            seconds = time.perf_counter() - start
+            print(
+                f"{name:<16} {seconds:7.2f}s  {images / seconds:7.1f} images/sec  "
+                f"{seconds / images * 1000:6.1f} ms/image"
+            )
+
+        if len({tuple(result.items()) for result in results.values()}) != 1:
+            print("warning: extracted text differs between cases")
+
+
+def benchmark_backends(images: int, workers: int):
+    """
+    Time OCR of a directory with each available backend.
+
+    Args:
+        images: Number of images in the synthetic directory
+        workers: Number of threads
+    """
+    backends = ["subprocess", "batch"]
+    if image_to_text.tesserocr is not None:
+        backends.append("tesserocr")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        build_image_directory(tmp_dir, images)
+
+        results = {}
+        for backend in backends:
+            start = time.perf_counter()
+            results[backend] = extract_text_from_directory(
+                tmp_dir, workers=workers, backend=backend
+            )
+            seconds = time.perf_counter() - start
+            print(
+                f"{backend:<16} {seconds:7.2f}s  {images / seconds:7.1f} images/sec  "
+                f"{seconds / images * 1000:6.1f} ms/image"
+            )
+
+        texts = {
+            tuple(text.strip() if text else text for text in result.values())
+            for result in results.values()
+        }
+        if len(texts) != 1:
+            print("warning: extracted text differs between backends")
+
+
+if __name__ == "__main__":
+    # image_to_text configures INFO logging on import; keep the timings readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark the OCR utilities")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    workers_parser = subparsers.add_parser(
+        "workers", help="Sequential vs threaded OCR of a directory"
+    )
+    workers_parser.add_argument(
+        "--images", type=int, default=300, help="Images in the synthetic directory"
+    )
+    workers_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Threads for the parallel case (default: number of CPUs)",
+    )
+    backends_parser = subparsers.add_parser(
+        "backends", help="Tesseract per image vs per batch vs tesserocr"
+    )
+    backends_parser.add_argument(
+        "--images", type=int, default=300, help="Images in the synthetic directory"
+    )
+    backends_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Threads (default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark == "workers":
+        benchmark_workers(args.images, args.workers)
+    elif args.benchmark == "backends":
+        benchmark_backends(args.images, args.workers)
@@ -0,0 +1,206 @@
+"""
+On-disk cache of OCR results.
+
+Results are stored in a SQLite database, keyed by a hash of the image file
+together with the OCR language, preprocessing setting and backend, so
+rerunning OCR over an image archive only processes new or changed images.
+
+Images are identified by a SHA-256 hash of the file. The hash is only
+recomputed when a file's size or modification time changes.
+
+Usage:
+    from ocr_cache import OcrCache
+
+    cache = OcrCache()
+    results = extract_text_from_directory("scans", cache=cache)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "image_to_text", "ocr_cache.sqlite3"
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+HASH_BLOCK_SIZE = 1 << 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+def result_key(digest: str, language: str, preprocess: bool, backend: str) -> str:
+    """
+    Build the cache key of an OCR result.
+
+    Args:
+        digest: Image file digest from OcrCache.file_digest
+        language: Tesseract language code
+        preprocess: Whether the image was preprocessed
+        backend: OCR backend that produced the text ('subprocess', 'batch' or
+            'tesserocr'); their whitespace and page separators differ
+
+    Returns:
+        str: Hex digest identifying the image and OCR settings
+    """
+    key = f"{digest}:{language}:{int(preprocess)}:{backend}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class OcrCache:
+    """
+    Cache OCR results on disk with a size limit.
+
+    When the stored text grows past max_bytes, the least recently used
+    results are evicted. Lookups are counted so callers can report the hit
+    rate.
+    """
+
+    def __init__(
+        self, cache_path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Open (or create) a cache database.
+
+        Args:
+            cache_path: Path to the SQLite database file
+            max_bytes: Maximum total size of the cached text
+        """
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(cache_path, timeout=30)
+        self.connection.executescript(SCHEMA)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups found in the cache (0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def file_digest(self, image_path: str) -> str:
+        """
+        Return the SHA-256 of a file, reusing the stored hash while the file's
+        size and modification time are unchanged.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            str: Hex digest of the file contents
+        """
+        path = os.path.abspath(image_path)
+        stat = os.stat(path)
+        row = self.connection.execute(
+            "SELECT digest FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns),
+        ).fetchone()
+        if row:
+            return row[0]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as image_file:
+            while block := image_file.read(HASH_BLOCK_SIZE):
+                digest.update(block)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+            (path, stat.st_size, stat.st_mtime_ns, digest.hexdigest()),
+        )
+        return digest.hexdigest()
+
+    def get(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up cached results and mark them as recently used.
+
+        Args:
+            keys: Result keys from result_key
+
+        Returns:
+            Dict[str, str]: Text of the cached results, by key
+        """
+        keys = list(keys)
+        unique_keys = list(set(keys))
+        texts = {}
+        # Stay under SQLite's limit on query parameters
+        for start in range(0, len(unique_keys), 500):
+            batch = unique_keys[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            texts.update(
+                self.connection.execute(
+                    f"SELECT key, text FROM results WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            )
+            self.connection.execute(
+                f"UPDATE results SET last_used = ? WHERE key IN ({placeholders})",
+                [time.time(), *batch],
+            )
+        self.connection.commit()
+        hits = sum(key in texts for key in keys)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return texts
+
+    def put(self, key: str, text: str):
+        """
+        Store one OCR result; call commit() to save it.
+
+        Args:
+            key: Result key from result_key
+            text: Extracted text
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+            (key, text, len(text.encode("utf-8")), time.time()),
+        )
+
+    def commit(self):
+        """Save stored results and evict old ones if the cache is too large."""
+        self.connection.commit()
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used results until the cache fits max_bytes."""
+        total = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = self.connection.execute(
+            "SELECT key, size FROM results ORDER BY last_used"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self.connection.commit()
+        logger.info(f"Evicted {evicted} results from the OCR cache")
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
@@ -1,26 +1,32 @@
+import hashlib
 import logging
+import os
 import pandas as pd
-import matplotlib.pyplot as plt
+from processing.processor import primary_hashtags
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+ENGAGEMENT_COLUMNS = ["likes", "retweets"]
+POSITIVE_WORDS = ["buy", "bullish", "profit", "up", "high", "rally"]
+NEGATIVE_WORDS = ["sell", "bearish", "loss", "down", "low", "crash"]
 
 
 class DataAnalyzer:
     """A class for analyzing tweet data."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, model_path: str | None = None):
         """
         Initializes the DataAnalyzer.
         Args:
             df: A pandas DataFrame with a 'content' column.
+            model_path: An optional trained sentiment classifier to use instead
+                of the keyword rules.
         """
         self.df = df
+        self.model_path = model_path
 
     def perform_sentiment_analysis(self) -> pd.DataFrame:
         """
-        Performs rule-based sentiment analysis on the tweet content.
+        Performs sentiment analysis on the tweet content, with the trained
+        classifier if a model path was given and keyword rules otherwise.
         Returns:
             A pandas DataFrame with an added 'sentiment' column.
         """
@@ -28,24 +34,163 @@ class DataAnalyzer:
             logging.error("DataFrame must have a 'content' column.")
             return self.df
 
-        positive_words = ["buy", "bullish", "profit", "up", "high", "rally"]
-        negative_words = ["sell", "bearish", "loss", "down", "low", "crash"]
-
-        def get_sentiment(text):
-            score = sum(1 for word in positive_words if word in text)
-            score -= sum(1 for word in negative_words if word in text)
-            if score > 0:
-                return "positive"
-            elif score < 0:
-                return "negative"
-            else:
-                return "neutral"
+        if self.model_path:
+            from analysis.classifier import load_classifier
 
-        self.df["sentiment"] = self.df["content"].apply(get_sentiment)
+            classifier = load_classifier(self.model_path)
+            self.df["sentiment"] = classifier.predict(self.df["content"])
+        else:
+            self.df["sentiment"] = self.df["content"].apply(rule_based_sentiment)
         logging.info("Sentiment analysis complete.")
         return self.df
 
 
+def rule_based_sentiment(text: str) -> str:
+    """
+    Scores a text by counting positive and negative market keywords.
+    Args:
+        text: The normalized tweet text.
+    Returns:
+        'positive', 'negative' or 'neutral'.
+    """
+    score = sum(1 for word in POSITIVE_WORDS if word in text)
+    score -= sum(1 for word in NEGATIVE_WORDS if word in text)
+    if score > 0:
+        return "positive"
+    elif score < 0:
+        return "negative"
+    else:
+        return "neutral"
+
+
+class SentimentRollup:
+    """A class to maintain time-bucketed sentiment and engagement aggregates."""
+
+    def __init__(self, rollup_dir: str, freqs: tuple[str, ...] = ("min", "h")):
+        """
+        Initializes the SentimentRollup.
+        Args:
+            rollup_dir: The directory holding one Parquet table per frequency.
+            freqs: The pandas frequencies to bucket tweets by.
+        """
+        self.rollup_dir = rollup_dir
+        self.freqs = freqs
+
+    def path(self, freq: str) -> str:
+        """
+        Returns the path of the rollup table for a frequency.
+        Args:
+            freq: A pandas frequency from freqs.
+        """
+        return os.path.join(self.rollup_dir, f"sentiment_{freq}.parquet")
+
+    def update(self, df: pd.DataFrame, overwrite: bool = False):
+        """
+        Adds analyzed tweets to the rollup tables.
+        Args:
+            df: A pandas DataFrame with 'timestamp', 'content' and 'sentiment'
+                columns.
+            overwrite: Whether to replace the tables instead of adding to them.
+        """
+        os.makedirs(self.rollup_dir, exist_ok=True)
+        tweets = pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(df["timestamp"]),
+                "hashtag": primary_hashtags(df).astype(str),
+                "sentiment": df["sentiment"].astype(str),
+                "tweets": 1,
+            }
+        )
+        for col in ENGAGEMENT_COLUMNS:
+            if col in df.columns:
+                tweets[col] = df[col].astype("int64")
+
+        for freq in self.freqs:
+            tweets["bucket"] = tweets["timestamp"].dt.floor(freq)
+            batch = self._aggregate(tweets.drop(columns="timestamp"))
+            path = self.path(freq)
+            if not overwrite and os.path.exists(path):
+                batch = self._aggregate(pd.concat([self.load(freq), batch]))
+            batch.to_parquet(path, index=False)
+        logging.info(f"Rollups updated with {len(df)} tweets in {self.rollup_dir}")
+
+    @staticmethod
+    def _aggregate(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sums tweets and engagement per bucket, hashtag and sentiment.
+        Args:
+            df: A pandas DataFrame of per-tweet or already aggregated rows.
+        Returns:
+            A pandas DataFrame with one row per bucket, hashtag and sentiment.
+        """
+        keys = ["bucket", "hashtag", "sentiment"]
+        table = df.groupby(keys, observed=True, sort=True).sum().reset_index()
+        for col in ["hashtag", "sentiment"]:
+            table[col] = table[col].astype("category")
+        return table
+
+    def load(
+        self,
+        freq: str = "h",
+        start: str | None = None,
+        end: str | None = None,
+        hashtags: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Reads a rollup table.
+        Args:
+            freq: The pandas frequency of the table.
+            start: The first bucket to include.
+            end: The last bucket to include.
+            hashtags: The hashtags to include, without '#'.
+        Returns:
+            A pandas DataFrame with 'bucket', 'hashtag', 'sentiment', 'tweets'
+            and engagement sum columns.
+        """
+        path = self.path(freq)
+        if not os.path.exists(path):
+            return pd.DataFrame(columns=["bucket", "hashtag", "sentiment", "tweets"])
+        table = pd.read_parquet(path)
+        tz = table["bucket"].dt.tz
+        if start is not None:
+            table = table[table["bucket"] >= self._bucket_time(start, tz)]
+        if end is not None:
+            table = table[table["bucket"] <= self._bucket_time(end, tz)]
+        if hashtags:
+            table = table[table["hashtag"].isin([h.lstrip("#") for h in hashtags])]
+        return table
+
+    @staticmethod
+    def _bucket_time(value: str, tz) -> pd.Timestamp:
+        """
+        Parses a bucket bound, assuming the table's timezone if none is given.
+        Args:
+            value: A date or datetime string.
+            tz: The timezone of the bucket column, or None.
+        """
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is None and tz is not None:
+            timestamp = timestamp.tz_localize(tz)
+        return timestamp
+
+    def sentiment_counts(self, **filters) -> pd.DataFrame:
+        """
+        Totals tweets per sentiment from the coarsest rollup.
+        Args:
+            **filters: Passed on to load (start, end, hashtags).
+        Returns:
+            A pandas DataFrame with 'sentiment' and 'count' columns.
+        """
+        table = self.load(self.freqs[-1], **filters)
+        counts = table.groupby("sentiment", observed=True)["tweets"].sum()
+        return (
+            counts.sort_values(ascending=False)
+            .rename("count")
+            .rename_axis("sentiment")
+            .reset_index()
+        )
+
+
 class Visualizer:
     """A class for visualizing tweet data."""
 
@@ -68,12 +213,104 @@ class Visualizer:
             return
 
         sentiment_counts = self.df["sentiment"].value_counts()
-        plt.figure(figsize=(8, 6))
-        sentiment_counts.plot(kind="bar", color=["green", "red", "blue"])
-        plt.title("Sentiment Distribution of Tweets")
-        plt.xlabel("Sentiment")
-        plt.ylabel("Number of Tweets")
-        plt.xticks(rotation=0)
-        plt.savefig(output_path)
+        self._plot_sentiment_counts(sentiment_counts, output_path)
+
+    def visualize_sentiment_counts(self, output_path: str):
+        """
+        Visualizes pre-aggregated sentiment counts without rescanning tweets.
+        Args:
+            output_path: The path to save the output plot.
+        """
+        if not {"sentiment", "count"}.issubset(self.df.columns):
+            logging.error("DataFrame needs 'sentiment' and 'count' columns.")
+            return
+
+        sentiment_counts = self.df.set_index("sentiment")["count"]
+        self._plot_sentiment_counts(sentiment_counts, output_path)
+
+    def visualize_sentiment_by_hashtag(self, output_dir: str) -> int:
+        """
+        Saves one sentiment chart per hashtag from a rollup table, reusing a
+        single figure and skipping charts whose counts have not changed.
+        Args:
+            output_dir: The directory to save the plots in.
+        Returns:
+            The number of charts that were (re)rendered.
+        """
+        if not {"hashtag", "sentiment", "tweets"}.issubset(self.df.columns):
+            logging.error(
+                "DataFrame needs 'hashtag', 'sentiment' and 'tweets' columns."
+            )
+            return 0
+
+        os.makedirs(output_dir, exist_ok=True)
+        counts = self.df.groupby(["hashtag", "sentiment"], observed=True)[
+            "tweets"
+        ].sum()
+        figure = None
+        rendered = 0
+        for hashtag, hashtag_counts in counts.groupby(level="hashtag", observed=True):
+            output_path = os.path.join(output_dir, f"sentiment_{hashtag}.png")
+            figure, drawn = self._plot_sentiment_counts(
+                hashtag_counts.droplevel("hashtag").sort_values(ascending=False),
+                output_path,
+                title=f"Sentiment Distribution of #{hashtag} Tweets",
+                figure=figure,
+            )
+            rendered += drawn
+        logging.info(f"Rendered {rendered} of {counts.index.levels[0].size} charts.")
+        return rendered
+
+    def _plot_sentiment_counts(
+        self,
+        sentiment_counts: pd.Series,
+        output_path: str,
+        title: str = "Sentiment Distribution of Tweets",
+        figure=None,
+    ):
+        """
+        Draws a bar chart of sentiment counts and saves it with the headless
+        Agg renderer. The chart is skipped if the file already shows the same
+        counts, which is tracked by a hash stored next to it.
+        Args:
+            sentiment_counts: Tweet counts indexed by sentiment.
+            output_path: The path to save the output plot.
+            title: The chart title.
+            figure: A matplotlib Figure to clear and reuse, if any.
+        Returns:
+            The Figure to reuse for the next chart (the one passed in, or None,
+            if rendering was skipped) and whether the chart was rendered.
+        """
+        digest = hashlib.sha256(
+            f"{title}|{sentiment_counts.to_json()}".encode("utf-8")
+        ).hexdigest()
+        hash_path = f"{output_path}.sha256"
+        if os.path.exists(output_path) and os.path.exists(hash_path):
+            with open(hash_path, "r", encoding="utf-8") as f:
+                if f.read().strip() == digest:
+                    logging.info(f"Plot {output_path} is up to date.")
+                    return figure, False
+
+        # Imported lazily and without pyplot, so no GUI backend or global
+        # figure state is involved
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        if figure is None:
+            figure = Figure(figsize=(8, 6))
+            FigureCanvasAgg(figure)
+        figure.clear()
+        ax = figure.add_subplot()
+        ax.bar(
+            sentiment_counts.index.astype(str),
+            sentiment_counts.to_numpy(),
+            color=["green", "red", "blue"],
+        )
+        ax.set_title(title)
+        ax.set_xlabel("Sentiment")
+        ax.set_ylabel("Number of Tweets")
+        figure.savefig(output_path)
+        with open(hash_path, "w", encoding="utf-8") as f:
+            f.write(digest)
         logging.info(f"Sentiment distribution plot saved to {output_path}")
-        plt.close()
+        return figure, True
@@ -0,0 +1,151 @@
+import logging
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+BATCH_SIZE = 50_000
+N_FEATURES = 2**18
+# All labels, so a batch missing one of them can still be learned from
+SENTIMENT_CLASSES = np.array(["negative", "neutral", "positive"])
+
+
+class SentimentClassifier:
+    """A class wrapping a hashed n-gram linear model for tweet sentiment."""
+
+    def __init__(self, model=None):
+        """
+        Initializes the SentimentClassifier.
+        Args:
+            model: A fitted scikit-learn linear classifier, or None to train
+                one with fit.
+        """
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        # The hashing vectorizer is stateless, so only the linear model has to
+        # be persisted and there is no vocabulary to hold in memory
+        self.vectorizer = HashingVectorizer(
+            n_features=N_FEATURES,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm="l2",
+        )
+        self.model = model
+
+    def fit(self, texts: pd.Series, labels: pd.Series, batch_size: int = BATCH_SIZE):
+        """
+        Trains a new model incrementally over batches of texts.
+        Args:
+            texts: A pandas Series of tweet text.
+            labels: A pandas Series of 'positive'/'negative'/'neutral' labels.
+            batch_size: The number of texts vectorized at once.
+        Returns:
+            The fitted SentimentClassifier.
+        """
+        self.model = None
+        return self.partial_fit(texts, labels, batch_size)
+
+    def partial_fit(
+        self, texts: pd.Series, labels: pd.Series, batch_size: int = BATCH_SIZE
+    ):
+        """
+        Continues training the model on more texts, or starts a new one.
+        Args:
+            texts: A pandas Series of tweet text.
+            labels: A pandas Series of 'positive'/'negative'/'neutral' labels.
+            batch_size: The number of texts vectorized at once.
+        Returns:
+            The updated SentimentClassifier.
+        """
+        from sklearn.linear_model import SGDClassifier
+
+        if self.model is None:
+            self.model = SGDClassifier(loss="log_loss", alpha=1e-6, random_state=0)
+        for start in range(0, len(texts), batch_size):
+            features = self.vectorizer.transform(
+                texts.iloc[start : start + batch_size].fillna("")
+            )
+            self.model.partial_fit(
+                features,
+                labels.iloc[start : start + batch_size].astype(str),
+                classes=SENTIMENT_CLASSES,
+            )
+        logging.info(f"Trained sentiment classifier on {len(texts)} tweets.")
+        return self
+
+    def predict(self, texts: pd.Series, batch_size: int = BATCH_SIZE) -> pd.Series:
+        """
+        Predicts sentiment with batched, sparse inference.
+        Args:
+            texts: A pandas Series of tweet text.
+            batch_size: The number of texts vectorized at once.
+        Returns:
+            A pandas Series of sentiment labels aligned with texts.
+        """
+        if self.model is None:
+            raise ValueError("The classifier has not been trained.")
+        predictions = [
+            self.model.predict(
+                self.vectorizer.transform(
+                    texts.iloc[start : start + batch_size].fillna("")
+                )
+            )
+            for start in range(0, len(texts), batch_size)
+        ]
+        labels = np.concatenate(predictions) if predictions else np.array([])
+        return pd.Series(labels, index=texts.index, dtype="category")
+
+    def save(self, filepath: str):
+        """
+        Saves the fitted model.
+        Args:
+            filepath: The path of the model file.
+        """
+        import joblib
+
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        joblib.dump(self.model, filepath)
+        logging.info(f"Sentiment classifier saved to {filepath}")
+
+    @classmethod
+    def load(cls, filepath: str) -> "SentimentClassifier":
+        """
+        Loads a saved model; use load_classifier to share it within a process.
+        Args:
+            filepath: The path of the model file.
+        Returns:
+            A new SentimentClassifier.
+        """
+        import joblib
+
+        return cls(joblib.load(filepath))
+
+
+@lru_cache(maxsize=4)
+def _load_cached(filepath: str, mtime: float) -> SentimentClassifier:
+    """
+    Loads a model file; cached per path and modification time.
+    Args:
+        filepath: The path of the model file.
+        mtime: The file's modification time, so a retrained model is reloaded.
+    Returns:
+        The loaded SentimentClassifier.
+    """
+    logging.info(f"Loading sentiment classifier from {filepath}")
+    return SentimentClassifier.load(filepath)
+
+
+def load_classifier(filepath: str) -> SentimentClassifier:
+    """
+    Loads a saved classifier once per process.
+    Args:
+        filepath: The path of the model file.
+    Returns:
+        The SentimentClassifier.
+
+    Raises:
+        FileNotFoundError: If the model file doesn't exist.
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"Sentiment model not found: {filepath}")
+    return _load_cached(os.path.abspath(filepath), os.path.getmtime(filepath))
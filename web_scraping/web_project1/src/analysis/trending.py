@@ -0,0 +1,233 @@
+import heapq
+import logging
+import os
+import pickle
+import zlib
+import numpy as np
+import pandas as pd
+
+LIKE_WEIGHT = 0.1
+RETWEET_WEIGHT = 0.5
+# Forward-decay weights grow as 2 ** (age / half-life); the sketch is rescaled
+# before they can overflow a float64
+MAX_DECAY_EXPONENT = 500
+
+
+class TrendingTracker:
+    """A class to find trending keys in a stream with a Count-Min Sketch."""
+
+    def __init__(
+        self,
+        k: int = 20,
+        width: int = 4096,
+        depth: int = 4,
+        half_life: str = "1h",
+    ):
+        """
+        Initializes the TrendingTracker.
+        Args:
+            k: The number of top keys to keep.
+            width: The number of counters per sketch row; the overestimate of
+                a count is at most about 2.7 / width of the total weight.
+            depth: The number of sketch rows (hash functions).
+            half_life: How long it takes a tweet's weight to halve, as a
+                pandas timedelta string.
+        """
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self.half_life = pd.Timedelta(half_life).total_seconds()
+        self.sketch = np.zeros((depth, width), dtype=np.float64)
+        self.landmark: float | None = None
+        self.latest: float | None = None
+        self._scores: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def _columns(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Hashes keys to one sketch column per row.
+        Args:
+            keys: A numpy array of unique string keys.
+        Returns:
+            A (depth, len(keys)) array of column indices.
+        """
+        return np.array(
+            [
+                [zlib.crc32(key.encode("utf-8"), row) % self.width for key in keys]
+                for row in range(self.depth)
+            ],
+            dtype=np.int64,
+        ).reshape(self.depth, len(keys))
+
+    def update(self, keys: pd.Series, weights: pd.Series, timestamps: pd.Series):
+        """
+        Adds a batch of weighted, timestamped keys to the sketch and the top-k.
+        Args:
+            keys: A pandas Series of keys (e.g. hashtags or usernames).
+            weights: A pandas Series of weights aligned with keys.
+            timestamps: A pandas Series of datetimes aligned with keys.
+        """
+        if keys.empty:
+            return
+        epoch = pd.Timestamp(0, tz="UTC")
+        seconds = (
+            (pd.to_datetime(timestamps, utc=True) - epoch) / pd.Timedelta(seconds=1)
+        ).to_numpy(dtype=np.float64)
+        if self.landmark is None:
+            self.landmark = float(seconds.min())
+            self.latest = self.landmark
+        self.latest = max(self.latest, float(seconds.max()))
+        if (self.latest - self.landmark) / self.half_life > MAX_DECAY_EXPONENT:
+            self._rescale(self.latest)
+
+        exponents = (seconds - self.landmark) / self.half_life
+        decayed = weights.to_numpy(dtype=np.float64) * np.exp2(exponents)
+        batch = pd.Series(decayed).groupby(keys.astype(str).to_numpy()).sum()
+
+        unique_keys = batch.index.to_numpy()
+        columns = self._columns(unique_keys)
+        for row in range(self.depth):
+            np.add.at(self.sketch[row], columns[row], batch.to_numpy())
+        estimates = self.sketch[np.arange(self.depth)[:, None], columns].min(axis=0)
+        for key, estimate in zip(unique_keys, estimates):
+            self._offer(key, float(estimate))
+
+    def _offer(self, key: str, score: float):
+        """
+        Updates the top-k heap with a key's latest estimate.
+        Args:
+            key: The key.
+            score: The key's forward-decayed count estimate.
+        """
+        if key in self._scores or len(self._scores) < self.k:
+            self._scores[key] = score
+            heapq.heappush(self._heap, (score, key))
+        else:
+            min_score, min_key = self._peek_min()
+            if score <= min_score:
+                return
+            del self._scores[min_key]
+            self._scores[key] = score
+            heapq.heappush(self._heap, (score, key))
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(score, key) for key, score in self._scores.items()]
+            heapq.heapify(self._heap)
+
+    def _peek_min(self) -> tuple[float, str]:
+        """
+        Returns the lowest-scored top-k entry, dropping outdated heap entries.
+        """
+        while self._scores.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def _rescale(self, new_landmark: float):
+        """
+        Moves the decay landmark forward, shrinking all stored weights.
+        Args:
+            new_landmark: The new landmark, in epoch seconds.
+        """
+        factor = np.exp2(-(new_landmark - self.landmark) / self.half_life)
+        self.sketch *= factor
+        self._scores = {key: score * factor for key, score in self._scores.items()}
+        self._heap = [(score, key) for key, score in self._scores.items()]
+        heapq.heapify(self._heap)
+        self.landmark = new_landmark
+
+    def top(self, now: pd.Timestamp | None = None) -> pd.DataFrame:
+        """
+        Lists the trending keys with their decayed scores.
+        Args:
+            now: The time to decay the scores to (default: the latest update).
+        Returns:
+            A pandas DataFrame with 'key' and 'score' columns, highest first.
+        """
+        if self.landmark is None:
+            return pd.DataFrame(columns=["key", "score"])
+        now_seconds = pd.Timestamp(now).timestamp() if now else self.latest
+        factor = np.exp2(-(now_seconds - self.landmark) / self.half_life)
+        top = pd.DataFrame(
+            [(key, score * factor) for key, score in self._scores.items()],
+            columns=["key", "score"],
+        )
+        return top.sort_values("score", ascending=False, ignore_index=True)
+
+
+def engagement_weights(df: pd.DataFrame) -> pd.Series:
+    """
+    Weights each tweet by its engagement, so widely shared tweets count more.
+    Args:
+        df: A pandas DataFrame of tweets.
+    Returns:
+        A pandas Series of weights, at least 1 per tweet.
+    """
+    weights = pd.Series(1.0, index=df.index)
+    if "likes" in df.columns:
+        weights += LIKE_WEIGHT * df["likes"].astype("float64")
+    if "retweets" in df.columns:
+        weights += RETWEET_WEIGHT * df["retweets"].astype("float64")
+    return weights
+
+
+def load_trackers(filepath: str) -> dict[str, TrendingTracker] | None:
+    """
+    Loads the trackers saved by a previous run.
+    Args:
+        filepath: The path of the state file.
+    Returns:
+        A dictionary of TrendingTrackers by kind, or None if there is no
+        readable saved state.
+    """
+    if not os.path.exists(filepath):
+        return None
+    try:
+        with open(filepath, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logging.warning(f"Ignoring unreadable trending state {filepath}: {e}")
+        return None
+
+
+def save_trackers(filepath: str, trackers: dict[str, TrendingTracker]):
+    """
+    Saves trackers so a later run can continue from them.
+    Args:
+        filepath: The path of the state file.
+        trackers: A dictionary of TrendingTrackers by kind.
+    """
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(trackers, f)
+    os.replace(tmp_path, filepath)
+
+
+def update_trending(
+    df: pd.DataFrame,
+    hashtags: TrendingTracker,
+    users: TrendingTracker,
+):
+    """
+    Feeds processed tweets to the hashtag and user trackers.
+    Args:
+        df: A pandas DataFrame of processed tweets.
+        hashtags: The tracker for hashtags.
+        users: The tracker for usernames.
+    """
+    tweets = df.sort_values("timestamp", kind="stable")
+    weights = engagement_weights(tweets)
+    users.update(tweets["username"], weights, tweets["timestamp"])
+
+    exploded = pd.DataFrame(
+        {
+            "hashtag": tweets["hashtags"],
+            "weight": weights,
+            "timestamp": tweets["timestamp"],
+        }
+    ).explode("hashtag")
+    exploded = exploded.dropna(subset=["hashtag"])
+    hashtags.update(
+        exploded["hashtag"].astype(str).str.lower(),
+        exploded["weight"],
+        exploded["timestamp"],
+    )
+    logging.info(f"Trending trackers updated with {len(tweets)} tweets.")
@@ -0,0 +1,274 @@
+"""
+Benchmarks for the tweet pipeline stages.
+
+Each case runs in a fresh process so its peak memory (max RSS) is measured in
+isolation from the others.
+
+Usage:
+    python benchmark.py processing --rows 5000000
+    python benchmark.py imports
+    python benchmark.py sentiment --rows 1000000
+"""
+
+import argparse
+import logging
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+def build_tweets_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Builds a synthetic raw tweets DataFrame without a per-row Python loop.
+    Args:
+        rows: The number of rows to generate.
+        seed: The random seed.
+    Returns:
+        A pandas DataFrame shaped like the collector's output, with about 5%
+        exact duplicates.
+    """
+    rng = np.random.default_rng(seed)
+    templates = np.array(
+        [
+            "Mock tweet about #NIFTY50. Feeling BUY. #stockmarket",
+            "Mock tweet about #sensex. Feeling crash ↓ #stockmarket",
+            "Mock tweet about #intraday. #stockmarket \U0001f680",
+            "Mock tweet about #BankNifty. Feeling rally. #StockMarket",
+        ]
+    )
+    unique_rows = rows - rows // 20
+    ids = rng.integers(0, unique_rows, rows)
+    ids[:unique_rows] = np.arange(unique_rows)
+    content = (
+        pd.Series(templates[ids % len(templates)]) + " #" + pd.Series(ids).astype(str)
+    )
+    start = pd.Timestamp("2024-01-01", tz="UTC")
+    return pd.DataFrame(
+        {
+            "username": "user_" + pd.Series(ids % 1000).astype(str),
+            "timestamp": start + pd.to_timedelta(ids % 86400, unit="s"),
+            "content": content.astype(object),
+            "likes": rng.integers(0, 1000, rows),
+            "retweets": rng.integers(0, 500, rows),
+        }
+    )
+
+
+def legacy_process_tweets(df: pd.DataFrame) -> pd.DataFrame:
+    """The text normalization and deduplication as originally implemented."""
+    df.drop_duplicates(subset=["content", "username", "timestamp"], inplace=True)
+    df.fillna({"content": ""}, inplace=True)
+    df["content"] = df["content"].str.lower()
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df["content"] = df["content"].str.encode("ascii", "ignore").str.decode("ascii")
+    return df
+
+
+def current_process_tweets(df: pd.DataFrame) -> pd.DataFrame:
+    """The text normalization and deduplication of DataProcessor."""
+    from processing.processor import DataProcessor
+
+    return DataProcessor(df).process_tweets()
+
+
+PROCESSING_CASES = {
+    "legacy": legacy_process_tweets,
+    "current": current_process_tweets,
+}
+
+
+def _reset_peak_memory() -> int:
+    """
+    Resets the process's peak RSS where the OS allows it (Linux).
+    Returns:
+        The peak RSS in KB to measure increases against.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+    return _peak_memory_kb()
+
+
+def _peak_memory_kb() -> int:
+    """
+    Reads the process's peak RSS.
+    Returns:
+        The peak RSS in KB.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_processing_case(name: str, rows: int) -> dict:
+    """
+    Runs one processing case and measures it (executed in a worker process).
+    Args:
+        name: The key of the case in PROCESSING_CASES.
+        rows: The number of rows to generate.
+    Returns:
+        A dictionary with the case's timing and memory results.
+    """
+    logging.getLogger().setLevel(logging.WARNING)
+    # Hand the only reference to the case so replaced columns can be freed
+    frames = [build_tweets_frame(rows)]
+    baseline_kb = _reset_peak_memory()
+    start = time.perf_counter()
+    result = PROCESSING_CASES[name](frames.pop())
+    elapsed = time.perf_counter() - start
+    peak_kb = _peak_memory_kb()
+    return {
+        "case": name,
+        "rows_out": len(result),
+        "seconds": elapsed,
+        "peak_increase_mb": (peak_kb - baseline_kb) / 1024,
+    }
+
+
+def benchmark_processing(rows: int):
+    """
+    Compares the legacy and current tweet processing on a synthetic frame.
+    Args:
+        rows: The number of rows to generate.
+    """
+    logging.info(f"Benchmarking tweet processing on {rows:,} rows.")
+    for name in PROCESSING_CASES:
+        # A fresh process per case keeps the max RSS measurements independent
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+            result = executor.submit(_run_processing_case, name, rows).result()
+        logging.info(
+            f"{result['case']:>8}: {result['seconds']:.2f}s, "
+            f"peak +{result['peak_increase_mb']:.0f} MB, "
+            f"{result['rows_out']:,} rows kept"
+        )
+
+
+IMPORT_CASES = {
+    "--help": ["--help"],
+    "collect-only": ["--collect-only"],
+}
+
+
+def measure_import_time(args: list[str], data_dir: str) -> float:
+    """
+    Runs main.py under `python -X importtime` and totals the import time.
+    Args:
+        args: The command-line arguments for main.py.
+        data_dir: The working directory for the run (outputs land in data/).
+    Returns:
+        The total time spent importing modules, in milliseconds.
+    """
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", main_path, *args],
+        cwd=data_dir,
+        capture_output=True,
+        text=True,
+    )
+    # Lines look like "import time: <self us> | <cumulative us> | <module>"
+    self_times = re.findall(r"^import time:\s+(\d+) \|", completed.stderr, re.M)
+    return sum(int(us) for us in self_times) / 1000
+
+
+def benchmark_imports(runs: int, data_dir: str):
+    """
+    Reports the import time of the pipeline's entry points.
+    Args:
+        runs: The number of runs per case; the median is reported.
+        data_dir: The working directory for the runs.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    for name, args in IMPORT_CASES.items():
+        times = sorted(measure_import_time(args, data_dir) for _ in range(runs))
+        logging.info(f"{name:>12}: {times[len(times) // 2]:.0f} ms importing")
+
+
+def benchmark_sentiment(rows: int):
+    """
+    Compares the throughput of the keyword rules and the trained classifier.
+    Args:
+        rows: The number of rows to generate.
+    """
+    from analysis.analyzer import DataAnalyzer, rule_based_sentiment
+    from analysis.classifier import SentimentClassifier
+    from processing.processor import normalize_text
+
+    texts = normalize_text(build_tweets_frame(rows)["content"])
+    labels = texts.map(rule_based_sentiment)
+    train_rows = min(rows, 200_000)
+    classifier = SentimentClassifier().fit(
+        texts.iloc[:train_rows], labels.iloc[:train_rows]
+    )
+
+    start = time.perf_counter()
+    DataAnalyzer(pd.DataFrame({"content": texts})).perform_sentiment_analysis()
+    rules_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictions = classifier.predict(texts)
+    model_seconds = time.perf_counter() - start
+
+    agreement = (predictions.astype(str) == labels).mean()
+    logging.info(f"   rules: {rows / rules_seconds:,.0f} tweets/s")
+    logging.info(
+        f"  model: {rows / model_seconds:,.0f} tweets/s "
+        f"({agreement:.1%} agreement with the rules)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the tweet pipeline")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    processing_parser = subparsers.add_parser(
+        "processing", help="Text normalization and deduplication"
+    )
+    processing_parser.add_argument(
+        "--rows", type=int, default=5_000_000, help="Rows to generate (default: 5M)"
+    )
+
+    imports_parser = subparsers.add_parser(
+        "imports", help="Import time of main.py entry points"
+    )
+    imports_parser.add_argument(
+        "--runs", type=int, default=5, help="Runs per case (default: 5)"
+    )
+    imports_parser.add_argument(
+        "--workdir",
+        type=str,
+        default="benchmark_runs",
+        help="Working directory for the runs (default: benchmark_runs)",
+    )
+
+    sentiment_parser = subparsers.add_parser(
+        "sentiment", help="Keyword rules vs. classifier throughput"
+    )
+    sentiment_parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Rows to score (default: 1M)"
+    )
+
+    args = parser.parse_args()
+    if args.benchmark == "processing":
+        benchmark_processing(args.rows)
+    elif args.benchmark == "imports":
+        benchmark_imports(args.runs, args.workdir)
+    elif args.benchmark == "sentiment":
+        benchmark_sentiment(args.rows)
@@ -3,10 +3,6 @@ import random
 from datetime import datetime, timedelta, timezone
 import pandas as pd
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-
 
 class DataCollector:
     """A class to collect mock tweet data."""
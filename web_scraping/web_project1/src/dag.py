@@ -0,0 +1,303 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable
+
+
+def _content_hash(value: Any) -> bytes:
+    """
+    Hashes an artifact by value.
+
+    pandas objects are hashed row by row: their pickled bytes change after an
+    unpickle round-trip even when the data is the same.
+    Args:
+        value: The artifact to hash.
+    Returns:
+        A SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(value, (pandas.DataFrame, pandas.Series)):
+        digest.update(repr(value.dtypes).encode("utf-8"))
+        try:
+            hashes = pandas.util.hash_pandas_object(value)
+        except TypeError:
+            # Cells holding lists or dicts are not hashable
+            hashes = pandas.util.hash_pandas_object(value.astype(str))
+        digest.update(hashes.to_numpy().tobytes())
+    else:
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    return digest.digest()
+
+
+class Stage:
+    """A pipeline step that turns named inputs into named outputs."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        inputs: tuple[str, ...] = (),
+        outputs: tuple[str, ...] = (),
+        params: dict | None = None,
+        paths: tuple[str, ...] = (),
+        cache: bool = True,
+    ):
+        """
+        Initializes the Stage.
+        Args:
+            name: A unique name for the stage.
+            func: The callable to run; it gets the inputs as keyword arguments
+                and returns one value per output (a tuple for several).
+            inputs: The names of the artifacts the stage consumes.
+            outputs: The names of the artifacts the stage produces.
+            params: Settings that change the stage's result; part of the cache
+                key.
+            paths: Files or directories the stage writes; a cached result is
+                only reused while they all exist.
+            cache: Whether the stage's outputs may be reused when its inputs
+                and params are unchanged.
+        """
+        self.name = name
+        self.func = func
+        self.inputs = inputs
+        self.outputs = outputs
+        self.params = params or {}
+        self.paths = paths
+        self.cache = cache
+
+
+class DagExecutor:
+    """A class to run stages concurrently in dependency order."""
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        max_workers: int = 4,
+        use_processes: bool = False,
+        cache_dir: str | None = None,
+    ):
+        """
+        Initializes the DagExecutor.
+        Args:
+            stages: The stages to run; each input must be the output of exactly
+                one other stage or be passed to run.
+            max_workers: The maximum number of stages running at once.
+            use_processes: Whether to run stages in a process pool instead of a
+                thread pool (stage functions and artifacts must be picklable).
+            cache_dir: The directory for cached stage outputs (default: no
+                caching).
+
+        Raises:
+            ValueError: If the graph has a cycle.
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.cache_dir = cache_dir
+        self.producers = {
+            output: stage.name for stage in stages for output in stage.outputs
+        }
+        self._check_acyclic()
+
+    def _dependencies(self, stage: Stage) -> set[str]:
+        """
+        Returns the names of the stages producing a stage's inputs.
+        Args:
+            stage: The stage to look up.
+        """
+        return {self.producers[name] for name in stage.inputs if name in self.producers}
+
+    def _check_acyclic(self):
+        """
+        Checks that the stages can be ordered.
+
+        Raises:
+            ValueError: If the graph has a cycle.
+        """
+        remaining = {
+            name: self._dependencies(stage) for name, stage in self.stages.items()
+        }
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Stages {sorted(remaining)} form a cycle")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def run(self, sources: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Runs all stages, starting each one as soon as its inputs are ready.
+        Args:
+            sources: Artifacts that no stage produces, by name.
+        Returns:
+            A dictionary with every artifact, by name.
+
+        Raises:
+            ValueError: If a stage input is neither produced nor a source.
+            Exception: The first exception raised by a stage.
+        """
+        artifacts: dict[str, Any] = dict(sources or {})
+        for stage in self.stages.values():
+            missing = [
+                name
+                for name in stage.inputs
+                if name not in self.producers and name not in artifacts
+            ]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' has unknown inputs {missing}")
+        pending = {
+            name: self._dependencies(stage) for name, stage in self.stages.items()
+        }
+        pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        with pool_class(max_workers=self.max_workers) as pool:
+            running: dict[Future, tuple[Stage, str | None]] = {}
+            cache_keys: dict[str, str | None] = {}
+            while pending or running:
+                for name in [name for name, deps in pending.items() if not deps]:
+                    del pending[name]
+                    stage = self.stages[name]
+                    inputs = {key: artifacts[key] for key in stage.inputs}
+                    cache_key = self._cache_key(stage, inputs, cache_keys)
+                    cache_keys[name] = cache_key
+                    cached = self._load_cached(stage, cache_key)
+                    if cached is not None:
+                        logging.info(f"Stage '{name}' is unchanged, skipping it.")
+                        self._finish(stage, cached, artifacts, pending)
+                        continue
+                    logging.info(f"Starting stage '{name}'.")
+                    running[pool.submit(stage.func, **inputs)] = (stage, cache_key)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, cache_key = running.pop(future)
+                    outputs = self._as_outputs(stage, future.result())
+                    self._store_cached(stage, cache_key, outputs)
+                    logging.info(f"Finished stage '{stage.name}'.")
+                    self._finish(stage, outputs, artifacts, pending)
+        return artifacts
+
+    @staticmethod
+    def _as_outputs(stage: Stage, result: Any) -> dict[str, Any]:
+        """
+        Maps a stage function's return value to its output names.
+        Args:
+            stage: The stage that ran.
+            result: The value the stage function returned.
+        Returns:
+            A dictionary of the stage's outputs.
+        """
+        if len(stage.outputs) == 1:
+            return {stage.outputs[0]: result}
+        if not stage.outputs:
+            return {}
+        return dict(zip(stage.outputs, result))
+
+    @staticmethod
+    def _finish(
+        stage: Stage,
+        outputs: dict[str, Any],
+        artifacts: dict[str, Any],
+        pending: dict[str, set[str]],
+    ):
+        """
+        Records a stage's outputs and unblocks the stages waiting on it.
+        Args:
+            stage: The completed stage.
+            outputs: The stage's outputs.
+            artifacts: All artifacts produced so far.
+            pending: The dependencies left for each stage not yet started.
+        """
+        artifacts.update(outputs)
+        for deps in pending.values():
+            deps.discard(stage.name)
+
+    def _cache_key(
+        self,
+        stage: Stage,
+        inputs: dict[str, Any],
+        cache_keys: dict[str, str | None],
+    ) -> str | None:
+        """
+        Hashes a stage's name, params and inputs.
+
+        An input produced by a cached stage is identified by that stage's cache
+        key, so a key only changes when something upstream changed; other
+        inputs are hashed by content.
+        Args:
+            stage: The stage about to run.
+            inputs: The stage's input artifacts.
+            cache_keys: The cache keys of the stages started so far, by name.
+        Returns:
+            A hex digest, or None if the stage is not cached.
+        """
+        if not (self.cache_dir and stage.cache):
+            return None
+        digest = hashlib.sha256(stage.name.encode("utf-8"))
+        digest.update(repr(sorted(stage.params.items())).encode("utf-8"))
+        for key in sorted(inputs):
+            digest.update(key.encode("utf-8"))
+            producer_key = cache_keys.get(self.producers.get(key))
+            if producer_key is not None:
+                digest.update(producer_key.encode("utf-8"))
+            else:
+                digest.update(_content_hash(inputs[key]))
+        return digest.hexdigest()
+
+    def _cache_path(self, stage: Stage) -> str:
+        """
+        Returns the path of a stage's cached outputs.
+        Args:
+            stage: The stage to look up.
+        """
+        return os.path.join(self.cache_dir, f"{stage.name}.pkl")
+
+    def _load_cached(self, stage: Stage, cache_key: str | None) -> dict | None:
+        """
+        Loads a stage's cached outputs if they were produced from the same key.
+        Args:
+            stage: The stage about to run.
+            cache_key: The stage's current cache key.
+        Returns:
+            The cached outputs, or None on a cache miss.
+        """
+        if cache_key is None or not os.path.exists(self._cache_path(stage)):
+            return None
+        if not all(os.path.exists(path) for path in stage.paths):
+            return None
+        try:
+            with open(self._cache_path(stage), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logging.warning(f"Ignoring unreadable cache for '{stage.name}': {e}")
+            return None
+        return entry["outputs"] if entry["key"] == cache_key else None
+
+    def _store_cached(self, stage: Stage, cache_key: str | None, outputs: dict):
+        """
+        Saves a stage's outputs under its cache key.
+        Args:
+            stage: The stage that ran.
+            cache_key: The stage's cache key, or None if it is not cached.
+            outputs: The stage's outputs.
+        """
+        if cache_key is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._cache_path(stage)}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": cache_key, "outputs": outputs}, f)
+        os.replace(tmp_path, self._cache_path(stage))
@@ -1,21 +1,38 @@
+from __future__ import annotations
+
+import argparse
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from collection.collector import DataCollector
-from processing.processor import DataProcessor
-from analysis.analyzer import DataAnalyzer, Visualizer
+from typing import TYPE_CHECKING
+from dag import DagExecutor, Stage
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Stage modules pull in pandas, pyarrow and matplotlib, so they are imported
+# inside the stage that needs them; `--help` or collect-only runs stay fast.
+if TYPE_CHECKING:
+    import pandas as pd
+    from processing.processor import DataProcessor
 
 
 class Pipeline:
     """A class to run the data collection, processing, and analysis pipeline."""
 
     def __init__(
-        self, hashtags: list[str], since_date: str, limit: int, data_dir: str = "data"
+        self,
+        hashtags: list[str],
+        since_date: str,
+        limit: int,
+        data_dir: str = "data",
+        incremental: bool = False,
+        partitioned: bool = False,
+        near_duplicate_threshold: float | None = None,
+        collect_only: bool = False,
+        raw_input: str | None = None,
+        max_workers: int = 4,
+        use_processes: bool = False,
+        use_cache: bool = True,
+        sentiment_model: str | None = None,
+        train_sentiment_model: bool = False,
     ):
         """
         Initializes the Pipeline.
@@ -24,17 +41,52 @@ class Pipeline:
             since_date: The start date for mock tweets (YYYY-MM-DD).
             limit: The number of mock tweets to generate.
             data_dir: The directory to store output files.
+            incremental: Whether to process only tweets newer than the watermark.
+            partitioned: Whether to save a date/hashtag partitioned dataset
+                instead of a single Parquet file.
+            near_duplicate_threshold: The similarity above which tweets are
+                dropped as near-duplicates (default: only exact duplicates).
+            collect_only: Whether to stop after saving the raw tweets.
+            raw_input: A Parquet file of raw tweets to use instead of collecting.
+            max_workers: The maximum number of stages running at once.
+            use_processes: Whether to run stages in processes instead of threads.
+            use_cache: Whether to skip stages whose inputs are unchanged.
+            sentiment_model: A trained sentiment classifier to use instead of
+                the keyword rules.
+            train_sentiment_model: Whether to first train the classifier on
+                this run's tweets, labelled by the keyword rules.
         """
         self.hashtags = hashtags
         self.since_date = since_date
         self.limit = limit
         self.data_dir = data_dir
+        self.incremental = incremental
+        self.partitioned = partitioned
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.collect_only = collect_only
+        self.raw_input = raw_input
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.use_cache = use_cache
+        self.sentiment_model = sentiment_model
+        if train_sentiment_model and not sentiment_model:
+            self.sentiment_model = os.path.join(self.data_dir, "sentiment_model.joblib")
+        self.train_sentiment_model = train_sentiment_model
+        self.cache_dir = os.path.join(self.data_dir, ".cache")
+        self.raw_data_path = os.path.join(self.data_dir, "raw_tweets.parquet")
         self.processed_data_path = os.path.join(
             self.data_dir, "processed_tweets.parquet"
         )
         self.visualization_path = os.path.join(
             self.data_dir, "sentiment_distribution.png"
         )
+        self.dataset_dir = os.path.join(self.data_dir, "processed_tweets")
+        self.watermark_path = os.path.join(self.data_dir, "watermark.json")
+        self.lsh_index_path = os.path.join(self.data_dir, "lsh_index.npz")
+        self.rollup_dir = os.path.join(self.data_dir, "rollups")
+        self.charts_dir = os.path.join(self.data_dir, "charts")
+        self.trending_path = os.path.join(self.data_dir, "trending.parquet")
+        self.trending_state_path = os.path.join(self.data_dir, "trending_state.pkl")
 
     def run(self):
         """Executes the entire data pipeline."""
@@ -42,33 +94,385 @@ class Pipeline:
         os.makedirs(self.data_dir, exist_ok=True)
 
         # Data Collection
-        collector = DataCollector(self.hashtags, self.since_date, self.limit)
-        raw_tweets_df = collector.generate_mock_tweets()
+        raw_tweets_df = self.collect()
         if raw_tweets_df.empty:
             logging.error("No tweets were collected. Exiting.")
             return
+        if self.collect_only:
+            raw_tweets_df.to_parquet(self.raw_data_path, index=False)
+            logging.info(f"Raw tweets saved to {self.raw_data_path}")
+            return
 
-        # Data Processing
-        processor = DataProcessor(raw_tweets_df)
-        processed_tweets_df = processor.process_tweets()
-        if processed_tweets_df.empty:
-            logging.error("No tweets left after processing. Exiting.")
+        if self.incremental:
+            self._run_incremental(self._processor(raw_tweets_df))
             return
-        processor.save_to_parquet(self.processed_data_path)
 
-        # Analysis and Visualization
-        analyzer = DataAnalyzer(processed_tweets_df)
-        analyzed_df = analyzer.perform_sentiment_analysis()
-        visualizer = Visualizer(analyzed_df)
-        visualizer.visualize_sentiment_distribution(self.visualization_path)
+        # Processing, saving, analysis and visualization, with saving and
+        # analysis running concurrently
+        executor = DagExecutor(
+            self._stages(),
+            max_workers=self.max_workers,
+            use_processes=self.use_processes,
+            cache_dir=self.cache_dir if self.use_cache else None,
+        )
+        try:
+            executor.run({"raw_tweets": raw_tweets_df})
+        except ValueError as e:
+            logging.error(f"{e}. Exiting.")
+            return
 
         logging.info("Pipeline finished successfully.")
 
+    def _stages(self) -> list[Stage]:
+        """
+        Declares the pipeline's stages after collection, which consume the
+        'raw_tweets' artifact.
+        Returns:
+            The stages, wired together by their inputs and outputs.
+        """
+        output_path = self.dataset_dir if self.partitioned else self.processed_data_path
+        analyze_inputs = ("processed_tweets",)
+        stages = []
+        if self.train_sentiment_model:
+            analyze_inputs += ("model_path",)
+            stages.append(
+                Stage(
+                    "train",
+                    self._train_stage,
+                    inputs=("processed_tweets",),
+                    outputs=("model_path",),
+                    paths=(self.sentiment_model,),
+                )
+            )
+        # Without training, a changed model file must invalidate the analysis
+        model_mtime = (
+            os.path.getmtime(self.sentiment_model)
+            if self.sentiment_model and os.path.exists(self.sentiment_model)
+            else None
+        )
+        return stages + [
+            Stage(
+                "process",
+                self._process_stage,
+                inputs=("raw_tweets",),
+                outputs=("processed_tweets",),
+                params={"near_duplicate_threshold": self.near_duplicate_threshold},
+            ),
+            Stage(
+                "save",
+                self._save_stage,
+                inputs=("processed_tweets",),
+                outputs=("saved_path",),
+                params={"partitioned": self.partitioned},
+                paths=(output_path,),
+            ),
+            Stage(
+                "analyze",
+                self._analyze_stage,
+                inputs=analyze_inputs,
+                outputs=("sentiment_counts", "hourly_rollup"),
+                params={"model": self.sentiment_model, "model_mtime": model_mtime},
+                paths=(self.rollup_dir,),
+            ),
+            Stage(
+                "trending",
+                self._trending_stage,
+                inputs=("processed_tweets",),
+                outputs=("trending",),
+                paths=(self.trending_path, self.trending_state_path),
+            ),
+            Stage(
+                "visualize",
+                self._visualize,
+                inputs=("sentiment_counts", "hourly_rollup"),
+                outputs=("charts_dir",),
+                paths=(self.visualization_path, self.charts_dir),
+            ),
+        ]
+
+    def collect(self) -> pd.DataFrame:
+        """
+        Collects the raw tweets, or reads them from raw_input if given.
+        Returns:
+            A pandas DataFrame with the raw tweets.
+        """
+        if self.raw_input:
+            import pandas as pd
+
+            return pd.read_parquet(self.raw_input)
+
+        from collection.collector import DataCollector
+
+        collector = DataCollector(self.hashtags, self.since_date, self.limit)
+        return collector.generate_mock_tweets()
+
+    def _processor(self, raw_tweets_df: pd.DataFrame) -> DataProcessor:
+        """
+        Builds the DataProcessor for the raw tweets.
+        Args:
+            raw_tweets_df: A pandas DataFrame with the raw tweets.
+        Returns:
+            A DataProcessor, with near-duplicate detection if configured.
+        """
+        from processing.processor import DataProcessor
+
+        near_duplicates = None
+        if self.near_duplicate_threshold is not None:
+            from processing.near_duplicates import NearDuplicateDetector
+
+            # Only incremental runs keep the index, so later runs see earlier tweets
+            near_duplicates = NearDuplicateDetector(
+                self.near_duplicate_threshold,
+                index_path=self.lsh_index_path if self.incremental else None,
+            )
+        return DataProcessor(raw_tweets_df, near_duplicates)
+
+    def _process_stage(self, raw_tweets: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cleans and normalizes a copy of the raw tweets.
+        Args:
+            raw_tweets: A pandas DataFrame with the raw tweets.
+        Returns:
+            A pandas DataFrame with the processed tweets.
+
+        Raises:
+            ValueError: If no tweets are left after processing.
+        """
+        processed_tweets = self._processor(raw_tweets.copy()).process_tweets()
+        if processed_tweets.empty:
+            raise ValueError("No tweets left after processing")
+        return processed_tweets
+
+    def _save_stage(self, processed_tweets: pd.DataFrame) -> str:
+        """
+        Saves the processed tweets.
+        Args:
+            processed_tweets: A pandas DataFrame with the processed tweets.
+        Returns:
+            The path of the saved file or dataset.
+        """
+        from processing.processor import DataProcessor
+
+        processor = DataProcessor(processed_tweets)
+        if self.partitioned:
+            processor.save_partitioned(self.dataset_dir)
+            return self.dataset_dir
+        processor.save_to_parquet(self.processed_data_path)
+        return self.processed_data_path
+
+    def _train_stage(self, processed_tweets: pd.DataFrame, resume: bool = False) -> str:
+        """
+        Trains the sentiment classifier on the keyword rules' labels.
+        Args:
+            processed_tweets: A pandas DataFrame with processed tweets.
+            resume: Whether to keep training the saved model, if there is one,
+                instead of starting a new one.
+        Returns:
+            The path of the saved model.
+        """
+        from analysis.analyzer import rule_based_sentiment
+        from analysis.classifier import SentimentClassifier
+
+        texts = processed_tweets["content"]
+        labels = texts.map(rule_based_sentiment, na_action="ignore")
+        if resume and os.path.exists(self.sentiment_model):
+            classifier = SentimentClassifier.load(self.sentiment_model)
+            classifier.partial_fit(texts, labels)
+        else:
+            classifier = SentimentClassifier().fit(texts, labels)
+        classifier.save(self.sentiment_model)
+        return self.sentiment_model
+
+    def _analyze_stage(
+        self,
+        processed_tweets: pd.DataFrame,
+        model_path: str | None = None,
+        overwrite: bool = True,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Scores the tweets' sentiment and adds them to the rollups.
+        Args:
+            processed_tweets: A pandas DataFrame with processed tweets.
+            model_path: The model produced by the train stage, if it ran.
+            overwrite: Whether to rebuild the rollups instead of adding to them.
+        Returns:
+            The overall sentiment counts and the hourly rollup table.
+        """
+        from analysis.analyzer import DataAnalyzer, SentimentRollup
+
+        # Sentiment is scored on a copy; other stages share the same frame
+        analyzer = DataAnalyzer(
+            processed_tweets.copy(), model_path or self.sentiment_model
+        )
+        rollup = SentimentRollup(self.rollup_dir)
+        rollup.update(analyzer.perform_sentiment_analysis(), overwrite=overwrite)
+        return rollup.sentiment_counts(), rollup.load()
+
+    def _trending_stage(
+        self, processed_tweets: pd.DataFrame, resume: bool = False
+    ) -> pd.DataFrame:
+        """
+        Finds the trending hashtags and users, weighted by engagement.
+        Args:
+            processed_tweets: A pandas DataFrame with processed tweets.
+            resume: Whether to continue from the saved tracker state instead of
+                starting over.
+        Returns:
+            A pandas DataFrame with the 'kind', 'key' and 'score' of each
+            trending hashtag and user.
+        """
+        import pandas as pd
+        from analysis.trending import (
+            TrendingTracker,
+            load_trackers,
+            save_trackers,
+            update_trending,
+        )
+
+        trackers = load_trackers(self.trending_state_path) if resume else None
+        trackers = trackers or {"hashtag": TrendingTracker(), "user": TrendingTracker()}
+        update_trending(processed_tweets, trackers["hashtag"], trackers["user"])
+        save_trackers(self.trending_state_path, trackers)
+        trending = pd.concat(
+            [tracker.top().assign(kind=kind) for kind, tracker in trackers.items()],
+            ignore_index=True,
+        )[["kind", "key", "score"]]
+        trending.to_parquet(self.trending_path, index=False)
+        logging.info(f"Trending hashtags and users saved to {self.trending_path}")
+        return trending
+
+    def _visualize(
+        self, sentiment_counts: pd.DataFrame, hourly_rollup: pd.DataFrame
+    ) -> str:
+        """
+        Saves the overall and per-hashtag sentiment charts from the rollups.
+        Args:
+            sentiment_counts: A pandas DataFrame with the sentiment totals.
+            hourly_rollup: The hourly rollup table.
+        Returns:
+            The directory of the per-hashtag charts.
+        """
+        from analysis.analyzer import Visualizer
+
+        Visualizer(sentiment_counts).visualize_sentiment_counts(self.visualization_path)
+        Visualizer(hourly_rollup).visualize_sentiment_by_hashtag(self.charts_dir)
+        return self.charts_dir
+
+    def _run_incremental(self, processor: DataProcessor):
+        """
+        Processes only unseen tweets, appends them to the dataset and updates
+        the aggregates.
+        Args:
+            processor: The DataProcessor holding this run's raw tweets.
+        """
+        from processing.watermark import Watermark
+
+        watermark = Watermark(self.watermark_path)
+        unseen_df = processor.filter_new(watermark.load())
+        if unseen_df.empty:
+            logging.info("No new tweets since the last run. Nothing to do.")
+            return
+        # Tweets dropped during processing still count as seen
+        newest = unseen_df["timestamp"].max()
+        new_tweets_df = processor.process_tweets()
+        if new_tweets_df.empty:
+            logging.info("No new tweets left after processing.")
+            watermark.save(newest, 0)
+            return
+        processor.append_to_dataset(self.dataset_dir)
+
+        if self.train_sentiment_model:
+            self._train_stage(new_tweets_df, resume=True)
+        self._visualize(*self._analyze_stage(new_tweets_df, overwrite=False))
+        self._trending_stage(new_tweets_df, resume=True)
+
+        watermark.save(newest, len(new_tweets_df))
+        logging.info("Incremental pipeline run finished successfully.")
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the tweet analysis pipeline")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Process only tweets newer than the stored watermark",
+    )
+    parser.add_argument(
+        "--partitioned",
+        action="store_true",
+        help=(
+            "Save a dataset partitioned by date and hashtag (implied by --incremental)"
+        ),
+    )
+    parser.add_argument(
+        "--near-duplicate-threshold",
+        type=float,
+        default=None,
+        help="Drop tweets at least this similar (0-1) to an earlier one",
+    )
+    parser.add_argument(
+        "--collect-only",
+        action="store_true",
+        help="Only collect tweets and save them to data/raw_tweets.parquet",
+    )
+    parser.add_argument(
+        "--raw-input",
+        type=str,
+        default=None,
+        help="Process raw tweets from this Parquet file instead of collecting",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum number of stages running at once (default: 4)",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Run stages in a process pool instead of a thread pool",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun every stage even if its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--sentiment-model",
+        type=str,
+        default=None,
+        help="Score sentiment with this trained classifier instead of keywords",
+    )
+    parser.add_argument(
+        "--train-sentiment-model",
+        action="store_true",
+        help="Train the classifier on this run's tweets (labelled by the keyword "
+        "rules) and use it; saved to --sentiment-model or "
+        "data/sentiment_model.joblib",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     hashtags_to_scrape = ["#nifty50", "#sensex", "#intraday", "#banknifty"]
     start_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
     tweet_limit = 2000
 
-    pipeline = Pipeline(hashtags_to_scrape, start_date, tweet_limit)
+    pipeline = Pipeline(
+        hashtags_to_scrape,
+        start_date,
+        tweet_limit,
+        incremental=args.incremental,
+        partitioned=args.partitioned,
+        near_duplicate_threshold=args.near_duplicate_threshold,
+        collect_only=args.collect_only,
+        raw_input=args.raw_input,
+        max_workers=args.workers,
+        use_processes=args.processes,
+        use_cache=not args.no_cache,
+        sentiment_model=args.sentiment_model,
+        train_sentiment_model=args.train_sentiment_model,
+    )
     pipeline.run()
@@ -0,0 +1,205 @@
+import logging
+import os
+import zlib
+import numpy as np
+import pandas as pd
+
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+class NearDuplicateDetector:
+    """A class to find near-duplicate texts with MinHash and LSH."""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        index_path: str | None = None,
+        seed: int = 1,
+    ):
+        """
+        Initializes the NearDuplicateDetector.
+        Args:
+            threshold: The estimated Jaccard similarity above which two texts
+                are considered near-duplicates.
+            num_perm: The number of MinHash permutations per signature.
+            shingle_size: The length of the character shingles.
+            index_path: An optional .npz file to load the LSH index from and
+                save it to, so detection continues across runs.
+            seed: The seed for the permutations; must stay the same for a
+                persisted index.
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.index_path = index_path
+        self.seed = seed
+        self.bands, self.rows = self._optimal_bands(threshold, num_perm)
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+
+        self.signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(self.bands)]
+        if index_path and os.path.exists(index_path):
+            self._load()
+
+    @staticmethod
+    def _optimal_bands(threshold: float, num_perm: int) -> tuple[int, int]:
+        """
+        Picks the LSH band layout whose similarity threshold, (1/b)^(1/r), is
+        closest to the requested one.
+        Args:
+            threshold: The target Jaccard similarity.
+            num_perm: The number of MinHash permutations.
+        Returns:
+            The number of bands and the number of rows per band.
+        """
+        candidates = [(bands, num_perm // bands) for bands in range(1, num_perm + 1)]
+        return min(
+            candidates,
+            key=lambda layout: abs((1 / layout[0]) ** (1 / layout[1]) - threshold),
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Computes the MinHash signature of a text.
+        Args:
+            text: The text to sign.
+        Returns:
+            A numpy array of num_perm uint32 values.
+        """
+        size = self.shingle_size
+        shingles = {text[i : i + size] for i in range(max(len(text) - size + 1, 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def find_near_duplicates(self, texts: pd.Series) -> pd.Series:
+        """
+        Flags texts that are near-duplicates of an indexed text or of an earlier
+        text in the same batch; all other texts are added to the index.
+        Args:
+            texts: A pandas Series of texts, processed in order.
+        Returns:
+            A boolean pandas Series, True for near-duplicates.
+        """
+        flags = np.zeros(len(texts), dtype=bool)
+        new_signatures = []
+        for position, text in enumerate(texts.fillna("")):
+            signature = self.signature(text)
+            if self._matches(signature, new_signatures):
+                flags[position] = True
+                continue
+            self._insert(signature, len(self.signatures) + len(new_signatures))
+            new_signatures.append(signature)
+
+        if new_signatures:
+            self.signatures = np.vstack([self.signatures, new_signatures])
+        logging.info(f"Found {int(flags.sum())} near-duplicates in {len(texts)} texts.")
+        return pd.Series(flags, index=texts.index)
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        """
+        Splits a signature into its per-band bucket keys.
+        Args:
+            signature: A MinHash signature.
+        Returns:
+            One bucket key per band.
+        """
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def _matches(self, signature: np.ndarray, pending: list[np.ndarray]) -> bool:
+        """
+        Checks whether a signature is similar enough to an indexed one.
+        Args:
+            signature: The MinHash signature to look up.
+            pending: Signatures indexed in this batch but not yet stacked.
+        Returns:
+            True if a candidate's estimated similarity reaches the threshold.
+        """
+        candidates = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(key, ()))
+
+        stored = len(self.signatures)
+        for candidate in candidates:
+            other = (
+                self.signatures[candidate]
+                if candidate < stored
+                else pending[candidate - stored]
+            )
+            if np.mean(other == signature) >= self.threshold:
+                return True
+        return False
+
+    def _insert(self, signature: np.ndarray, doc_id: int):
+        """
+        Adds a signature to the LSH buckets.
+        Args:
+            signature: The MinHash signature to add.
+            doc_id: The row of the signature in the signature matrix.
+        """
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, []).append(doc_id)
+
+    def save(self):
+        """Persists the signatures of the index to index_path."""
+        if not self.index_path:
+            return
+        np.savez_compressed(
+            self.index_path,
+            signatures=self.signatures,
+            threshold=self.threshold,
+            shingle_size=self.shingle_size,
+            seed=self.seed,
+        )
+        logging.info(
+            f"Saved LSH index with {len(self.signatures)} signatures to "
+            f"{self.index_path}"
+        )
+
+    def _load(self):
+        """
+        Loads the signatures from index_path and rebuilds the buckets. An
+        index built with other settings is ignored and rebuilt from scratch,
+        since its signatures can't be compared with new ones.
+        """
+        with np.load(self.index_path) as index:
+            signatures = index["signatures"]
+            saved = {
+                key: index[key].item()
+                for key in ("threshold", "shingle_size", "seed")
+                if key in index
+            }
+        saved["num_perm"] = signatures.shape[1]
+        expected = {
+            "threshold": self.threshold,
+            "shingle_size": self.shingle_size,
+            "seed": self.seed,
+            "num_perm": self.num_perm,
+        }
+        mismatched = [
+            f"{key}={saved.get(key)} (expected {value})"
+            for key, value in expected.items()
+            if saved.get(key) != value
+        ]
+        if mismatched:
+            logging.warning(
+                f"Rebuilding LSH index {self.index_path}: built with "
+                f"{', '.join(mismatched)}."
+            )
+            return
+        self.signatures = signatures
+        for doc_id, signature in enumerate(signatures):
+            self._insert(signature, doc_id)
+        logging.info(f"Loaded LSH index with {len(signatures)} signatures.")
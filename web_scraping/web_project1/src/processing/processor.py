@@ -1,21 +1,38 @@
+import json
 import logging
+import uuid
+from datetime import datetime, timezone
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from processing.near_duplicates import NearDuplicateDetector
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+PARTITION_COLUMNS = ["date", "hashtag"]
+DICTIONARY_COLUMNS = ["username", "hashtags", "mentions"]
+ROW_GROUP_SIZE = 64_000
+CATEGORY_COLUMNS = ["username"]
+DEDUP_COLUMNS = ["content", "username", "timestamp"]
+CHUNK_ROWS = 250_000
 
 
 class DataProcessor:
     """A class to process tweet data."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        near_duplicates: NearDuplicateDetector | None = None,
+    ):
         """
         Initializes the DataProcessor.
         Args:
             df: A pandas DataFrame containing tweet data.
+            near_duplicates: An optional detector used to also drop tweets
+                whose text nearly matches an earlier one.
         """
         self.df = df
+        self.near_duplicates = near_duplicates
 
     def process_tweets(self) -> pd.DataFrame:
         """
@@ -27,30 +44,315 @@ class DataProcessor:
             logging.warning("Input DataFrame is empty. No processing will be done.")
             return self.df
 
-        # Handle duplicates and missing values
-        self.df.drop_duplicates(
-            subset=["content", "username", "timestamp"], inplace=True
-        )
+        # Handle duplicates on a 64-bit hash of the key columns instead of
+        # comparing the full text, then fill missing values
+        key_hashes = hash_rows(self.df[DEDUP_COLUMNS])
+        self.df = self.df[~key_hashes.duplicated().to_numpy()]
         self.df.fillna({"content": ""}, inplace=True)
 
         # Normalize text and convert timestamp
-        self.df["content"] = self.df["content"].str.lower()
+        self.df["content"] = normalize_text(self.df["content"])
         self.df["timestamp"] = pd.to_datetime(self.df["timestamp"])
-        self.df["content"] = (
-            self.df["content"].str.encode("ascii", "ignore").str.decode("ascii")
-        )
+        if self.near_duplicates is not None:
+            self.remove_near_duplicates()
+        self.optimize_dtypes()
 
         logging.info(f"Processed {len(self.df)} tweets.")
         return self.df
 
+    def remove_near_duplicates(self) -> pd.DataFrame:
+        """
+        Drops tweets whose text is a near-duplicate of an earlier tweet, feeding
+        the detector in chunks so its index grows as a stream.
+        Returns:
+            A pandas DataFrame without the near-duplicate tweets.
+        """
+        self.df = self.df.sort_values("timestamp", kind="stable")
+        flags = [
+            self.near_duplicates.find_near_duplicates(
+                self.df["content"].iloc[start : start + CHUNK_ROWS]
+            )
+            for start in range(0, len(self.df), CHUNK_ROWS)
+        ]
+        if flags:
+            self.df = self.df[~pd.concat(flags).to_numpy()]
+        self.near_duplicates.save()
+        logging.info(f"{len(self.df)} tweets left after near-duplicate removal.")
+        return self.df
+
+    def optimize_dtypes(self) -> dict[str, int]:
+        """
+        Converts the DataFrame to memory-compact dtypes: categoricals for
+        low-cardinality text, Arrow-backed strings and lists for the rest, and
+        the smallest integer type that fits each count column.
+        Returns:
+            A dictionary with the memory usage in bytes 'before' and 'after'.
+        """
+        before = int(self.df.memory_usage(deep=True).sum())
+
+        for col in self.df.columns:
+            series = self.df[col]
+            if pd.api.types.is_integer_dtype(series.dtype):
+                downcast = "unsigned" if series.min() >= 0 else "integer"
+                self.df[col] = pd.to_numeric(series, downcast=downcast)
+            elif col in CATEGORY_COLUMNS:
+                self.df[col] = series.astype("category")
+            elif series.dtype == object or pd.api.types.is_string_dtype(series):
+                sample = series.dropna()
+                if not sample.empty and isinstance(sample.iloc[0], list):
+                    self.df[col] = series.astype(pd.ArrowDtype(pa.list_(pa.string())))
+                else:
+                    self.df[col] = series.astype("string[pyarrow]")
+
+        report = {
+            "before": before,
+            "after": int(self.df.memory_usage(deep=True).sum()),
+        }
+        logging.info(
+            f"Optimized dtypes: {report['before']:,} -> {report['after']:,} bytes."
+        )
+        return report
+
+    def filter_new(self, watermark: pd.Timestamp | None) -> pd.DataFrame:
+        """
+        Keeps only the tweets newer than the given watermark.
+        Args:
+            watermark: The newest timestamp already processed, or None.
+        Returns:
+            A pandas DataFrame with the unseen tweets.
+        """
+        if self.df.empty:
+            return self.df
+
+        self.df["timestamp"] = pd.to_datetime(self.df["timestamp"])
+        if watermark is None:
+            return self.df
+        self.df = self.df[self.df["timestamp"] > watermark].copy()
+        logging.info(f"{len(self.df)} tweets are newer than {watermark}.")
+        return self.df
+
+    def append_to_dataset(self, dataset_dir: str) -> str | None:
+        """
+        Appends the DataFrame to a partitioned Parquet dataset as new part files.
+        Args:
+            dataset_dir: The root directory of the dataset.
+        Returns:
+            The basename template of the written files, or None if nothing was
+            written.
+        """
+        if self.df.empty:
+            return None
+
+        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        basename = f"part-{run_id}-{uuid.uuid4().hex[:8]}-{{i}}.parquet"
+        self.save_partitioned(dataset_dir, basename=basename, overwrite=False)
+        return basename
+
+    def save_partitioned(
+        self,
+        dataset_dir: str,
+        basename: str = "part-{i}.parquet",
+        overwrite: bool = True,
+    ):
+        """
+        Saves the DataFrame as a hive-style dataset partitioned by day and
+        primary hashtag (e.g. date=2024-01-01/hashtag=nifty50/part-0.parquet).
+        Args:
+            dataset_dir: The root directory of the dataset.
+            basename: The file name template for the written part files.
+            overwrite: Whether to replace partitions that already exist or to
+                add files next to them.
+        """
+        import pyarrow.dataset as ds
+
+        try:
+            table = to_arrow_table(self._with_partition_columns())
+            file_format = ds.ParquetFileFormat()
+            ds.write_dataset(
+                table,
+                dataset_dir,
+                format=file_format,
+                partitioning=ds.partitioning(
+                    pa.schema([(col, pa.string()) for col in PARTITION_COLUMNS]),
+                    flavor="hive",
+                ),
+                file_options=file_format.make_write_options(
+                    use_dictionary=[
+                        col for col in DICTIONARY_COLUMNS if col in table.column_names
+                    ],
+                    compression="snappy",
+                ),
+                basename_template=basename,
+                max_rows_per_group=ROW_GROUP_SIZE,
+                min_rows_per_group=min(ROW_GROUP_SIZE, len(table)),
+                existing_data_behavior=(
+                    "delete_matching" if overwrite else "overwrite_or_ignore"
+                ),
+            )
+            logging.info(f"Data saved to partitioned dataset {dataset_dir}")
+        except Exception as e:
+            logging.error(f"Failed to save partitioned dataset: {e}")
+
+    def _with_partition_columns(self) -> pd.DataFrame:
+        """
+        Derives the partition columns from each tweet.
+        Returns:
+            A copy of the DataFrame with 'date' and 'hashtag' columns added.
+        """
+        df = self.df.copy()
+        df["date"] = pd.to_datetime(df["timestamp"]).dt.strftime("%Y-%m-%d")
+        df["hashtag"] = primary_hashtags(df)
+        return df
+
     def save_to_parquet(self, filepath: str):
         """
         Saves the DataFrame to a Parquet file.
         Args:
             filepath: The path to the output Parquet file.
         """
+        import pyarrow.parquet as pq
+
         try:
-            self.df.to_parquet(filepath, index=False)
+            pq.write_table(to_arrow_table(self.df), filepath)
             logging.info(f"Data saved to {filepath}")
         except Exception as e:
             logging.error(f"Failed to save data to Parquet: {e}")
+
+
+def to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Converts a DataFrame to an Arrow table that plain pd.read_parquet can read.
+    pandas records Arrow list columns as 'list<item: string>[pyarrow]' in the
+    Parquet metadata and cannot parse that back, so they are recorded as
+    ordinary list columns instead; read_tweets maps them back to ArrowDtype.
+    Args:
+        df: A pandas DataFrame.
+    Returns:
+        A pyarrow Table without the index.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = json.loads(table.schema.metadata[b"pandas"])
+    for column in metadata["columns"]:
+        dtype = df.dtypes.get(column["name"])
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_list(dtype.pyarrow_dtype):
+            column["pandas_type"] = "list[unicode]"
+            column["numpy_type"] = "object"
+    return table.replace_schema_metadata(
+        {**table.schema.metadata, b"pandas": json.dumps(metadata).encode("utf-8")}
+    )
+
+
+def primary_hashtags(df: pd.DataFrame) -> pd.Series:
+    """
+    Finds each tweet's primary hashtag: the first one in the text (the topic
+    the tweet was collected for), falling back to the hashtags list.
+    Args:
+        df: A pandas DataFrame with a 'content' and optionally a 'hashtags'
+            column.
+    Returns:
+        A pandas Series of lowercase hashtags without '#', 'none' if missing.
+    """
+    primary = df["content"].str.extract(r"#(\w+)", expand=False)
+    if "hashtags" in df.columns:
+        fallback = df["hashtags"].map(
+            lambda tags: tags[0] if len(tags) else None, na_action="ignore"
+        )
+        primary = primary.fillna(fallback)
+    return primary.fillna("none").str.lower()
+
+
+def hash_rows(df: pd.DataFrame) -> pd.Series:
+    """
+    Computes a 64-bit hash per row, in chunks so the temporary encoded copies
+    of text columns stay small.
+    Args:
+        df: A pandas DataFrame with the columns to hash.
+    Returns:
+        A pandas Series of uint64 row hashes.
+    """
+    chunks = [
+        pd.util.hash_pandas_object(
+            df.iloc[start : start + CHUNK_ROWS], index=False, categorize=False
+        ).to_numpy()
+        for start in range(0, len(df), CHUNK_ROWS)
+    ]
+    hashes = np.concatenate(chunks) if chunks else np.array([], dtype="uint64")
+    return pd.Series(hashes, index=df.index)
+
+
+def normalize_text(content: pd.Series) -> pd.Series:
+    """
+    Lowercases text and strips non-ASCII characters inside Arrow, chunk by
+    chunk, without materializing intermediate Python string or bytes columns.
+    Args:
+        content: A pandas Series of tweet text.
+    Returns:
+        A pandas Series of normalized, Arrow-backed strings.
+    """
+    chunks = []
+    for start in range(0, len(content), CHUNK_ROWS):
+        text = pa.array(
+            content.iloc[start : start + CHUNK_ROWS],
+            type=pa.large_string(),
+            from_pandas=True,
+        )
+        text = pc.replace_substring_regex(pc.utf8_lower(text), r"[^\x00-\x7F]", "")
+        chunks.append(text)
+    normalized = pa.chunked_array(chunks, type=pa.large_string()).to_pandas(
+        types_mapper={pa.large_string(): pd.StringDtype("pyarrow")}.get
+    )
+    normalized.index = content.index
+    normalized.name = content.name
+    return normalized
+
+
+def read_tweets(
+    dataset_dir: str,
+    columns: list[str] | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    hashtags: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Reads tweets from a partitioned dataset, pushing the filters and the column
+    projection down to pyarrow so only the matching files and columns are read.
+    Args:
+        dataset_dir: The root directory of the dataset.
+        columns: The columns to read (default: all).
+        start_date: The first day to include (YYYY-MM-DD).
+        end_date: The last day to include (YYYY-MM-DD).
+        hashtags: The primary hashtags to include, without '#'.
+    Returns:
+        A pandas DataFrame with the matching tweets.
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(
+        dataset_dir,
+        format="parquet",
+        partitioning=ds.partitioning(
+            pa.schema([(col, pa.string()) for col in PARTITION_COLUMNS]),
+            flavor="hive",
+        ),
+    )
+
+    conditions = []
+    if start_date:
+        conditions.append(ds.field("date") >= start_date)
+    if end_date:
+        conditions.append(ds.field("date") <= end_date)
+    if hashtags:
+        conditions.append(
+            ds.field("hashtag").isin([tag.lstrip("#").lower() for tag in hashtags])
+        )
+    row_filter = None
+    for condition in conditions:
+        row_filter = condition if row_filter is None else row_filter & condition
+
+    table = dataset.to_table(columns=columns, filter=row_filter)
+    logging.info(f"Read {table.num_rows} tweets from {dataset_dir}")
+    # List columns are stored as plain lists in the pandas metadata (see
+    # to_arrow_table), so they are mapped back to ArrowDtype explicitly.
+    return table.to_pandas(
+        types_mapper=lambda t: pd.ArrowDtype(t) if pa.types.is_list(t) else None
+    )
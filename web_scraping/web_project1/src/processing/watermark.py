@@ -0,0 +1,46 @@
+import json
+import logging
+import os
+import pandas as pd
+
+
+class Watermark:
+    """A class to track the newest tweet already processed by the pipeline."""
+
+    def __init__(self, filepath: str):
+        """
+        Initializes the Watermark.
+        Args:
+            filepath: The path to the JSON file holding the watermark.
+        """
+        self.filepath = filepath
+
+    def load(self) -> pd.Timestamp | None:
+        """
+        Loads the stored watermark.
+        Returns:
+            The newest processed timestamp, or None if nothing was processed yet.
+        """
+        if not os.path.exists(self.filepath):
+            return None
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return pd.Timestamp(state["timestamp"])
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Ignoring unreadable watermark {self.filepath}: {e}")
+            return None
+
+    def save(self, timestamp: pd.Timestamp, rows: int):
+        """
+        Persists a new watermark.
+        Args:
+            timestamp: The newest timestamp that has been processed.
+            rows: The number of rows processed in the run that advanced it.
+        """
+        state = {"timestamp": pd.Timestamp(timestamp).isoformat(), "rows": rows}
+        tmp_path = f"{self.filepath}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.filepath)
+        logging.info(f"Watermark advanced to {state['timestamp']}")